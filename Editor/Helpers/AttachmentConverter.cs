@@ -0,0 +1,93 @@
+using System;
+using System.Collections.Generic;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP.Editor.Helpers
+{
+    /// <summary>
+    /// Carries byte arrays as binary attachments: raw frames sent ahead of a JSON message
+    /// and referenced from it as {"$attachment": index}. Used on connections that negotiated
+    /// the "attachments" feature; elsewhere byte arrays keep serializing as base64 strings.
+    /// </summary>
+    public sealed class AttachmentConverter : JsonConverter
+    {
+        private const string PlaceholderKey = "$attachment";
+        private readonly List<byte[]> attachments;
+
+        /// <summary>
+        /// Creates a converter that collects serialized byte arrays into the given list.
+        /// </summary>
+        /// <param name="attachments">Receives the attachments in the order they are referenced.</param>
+        public AttachmentConverter(List<byte[]> attachments)
+        {
+            this.attachments = attachments;
+        }
+
+        public override bool CanConvert(Type objectType) => objectType == typeof(byte[]);
+
+        public override bool CanRead => false;
+
+        public override void WriteJson(JsonWriter writer, object value, JsonSerializer serializer)
+        {
+            writer.WriteStartObject();
+            writer.WritePropertyName(PlaceholderKey);
+            writer.WriteValue(attachments.Count);
+            writer.WriteEndObject();
+            attachments.Add((byte[])value);
+        }
+
+        public override object ReadJson(JsonReader reader, Type objectType, object existingValue, JsonSerializer serializer)
+        {
+            throw new NotSupportedException();
+        }
+
+        /// <summary>
+        /// Replaces attachment placeholders in a received message with the attached bytes.
+        /// </summary>
+        /// <param name="token">The message, or part of it, to resolve in place.</param>
+        /// <param name="received">Attachments received ahead of the message.</param>
+        public static void Resolve(JToken token, IReadOnlyList<byte[]> received)
+        {
+            switch (token)
+            {
+                case JObject obj:
+                    foreach (var property in new List<JProperty>(obj.Properties()))
+                    {
+                        if (TryGetIndex(property.Value, out int index))
+                            property.Value = Lookup(received, index);
+                        else
+                            Resolve(property.Value, received);
+                    }
+                    break;
+                case JArray array:
+                    for (int i = 0; i < array.Count; i++)
+                    {
+                        if (TryGetIndex(array[i], out int index))
+                            array[i] = Lookup(received, index);
+                        else
+                            Resolve(array[i], received);
+                    }
+                    break;
+            }
+        }
+
+        private static JValue Lookup(IReadOnlyList<byte[]> received, int index)
+        {
+            if (index < 0 || index >= received.Count)
+                throw new ArgumentException($"Message references missing attachment {index}");
+            return new JValue(received[index]);
+        }
+
+        private static bool TryGetIndex(JToken token, out int index)
+        {
+            index = -1;
+            if (token is JObject obj && obj.Count == 1 && obj[PlaceholderKey] is JValue value && value.Type == JTokenType.Integer)
+            {
+                index = value.ToObject<int>();
+                return true;
+            }
+            return false;
+        }
+    }
+}
@@ -0,0 +1,329 @@
+using System;
+using System.IO;
+using System.Numerics;
+using System.Text;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP.Editor.Helpers
+{
+    /// <summary>
+    /// Converts bridge messages between JSON text and MessagePack.
+    /// Connections that negotiate the "msgpack" codec exchange MessagePack on the wire,
+    /// while commands and responses stay JSON strings everywhere else in the bridge.
+    /// </summary>
+    public static class MessagePackTranscoder
+    {
+        /// <summary>
+        /// Converts a MessagePack-encoded value to JSON text. Binary values become base64 strings.
+        /// </summary>
+        /// <param name="data">Buffer holding the encoded value.</param>
+        /// <param name="offset">Offset of the value in the buffer.</param>
+        /// <param name="count">Length of the encoded value.</param>
+        /// <returns>The value as JSON text.</returns>
+        public static string ToJson(byte[] data, int offset, int count)
+        {
+            var reader = new Reader(data, offset, offset + count);
+            using var text = new StringWriter();
+            using (var writer = new JsonTextWriter(text))
+            {
+                reader.CopyValue(writer);
+            }
+            if (reader.Position != offset + count)
+                throw new InvalidDataException("Trailing bytes after MessagePack value");
+            return text.ToString();
+        }
+
+        /// <summary>
+        /// Converts JSON text to MessagePack, leaving room for a frame header in front.
+        /// </summary>
+        /// <param name="json">The JSON text to convert.</param>
+        /// <param name="headerSize">Number of bytes to reserve before the encoded value.</param>
+        /// <returns>A buffer holding the reserved bytes followed by the encoded value.</returns>
+        public static byte[] FromJson(string json, int headerSize = 0)
+        {
+            // Strings that look like dates must stay strings
+            using var jsonReader = new JsonTextReader(new StringReader(json)) { DateParseHandling = DateParseHandling.None };
+            var token = JToken.ReadFrom(jsonReader);
+            using var output = new MemoryStream();
+            output.SetLength(headerSize);
+            output.Position = headerSize;
+            Write(output, token);
+            return output.ToArray();
+        }
+
+        private static void Write(Stream output, JToken token)
+        {
+            switch (token.Type)
+            {
+                case JTokenType.Object:
+                    var obj = (JObject)token;
+                    WriteHeader(output, obj.Count, 0x80, 0xde);
+                    foreach (var property in obj.Properties())
+                    {
+                        WriteString(output, property.Name);
+                        Write(output, property.Value);
+                    }
+                    break;
+                case JTokenType.Array:
+                    var array = (JArray)token;
+                    WriteHeader(output, array.Count, 0x90, 0xdc);
+                    foreach (var item in array)
+                        Write(output, item);
+                    break;
+                case JTokenType.Integer:
+                    var value = ((JValue)token).Value;
+                    if (value is BigInteger big)
+                    {
+                        if (big < long.MinValue || big > ulong.MaxValue)
+                            WriteDouble(output, (double)big);
+                        else if (big > long.MaxValue)
+                            WriteUInt64(output, (ulong)big);
+                        else
+                            WriteInteger(output, (long)big);
+                    }
+                    else
+                    {
+                        WriteInteger(output, Convert.ToInt64(value));
+                    }
+                    break;
+                case JTokenType.Float:
+                    WriteDouble(output, token.Value<double>());
+                    break;
+                case JTokenType.Boolean:
+                    output.WriteByte(token.Value<bool>() ? (byte)0xc3 : (byte)0xc2);
+                    break;
+                case JTokenType.Null:
+                case JTokenType.Undefined:
+                    output.WriteByte(0xc0);
+                    break;
+                default:
+                    WriteString(output, token.ToString());
+                    break;
+            }
+        }
+
+        private static void WriteHeader(Stream output, int count, byte fixPrefix, byte prefix16)
+        {
+            if (count < 16)
+            {
+                output.WriteByte((byte)(fixPrefix | count));
+            }
+            else if (count <= ushort.MaxValue)
+            {
+                output.WriteByte(prefix16);
+                WriteBigEndian(output, (ulong)count, 2);
+            }
+            else
+            {
+                output.WriteByte((byte)(prefix16 + 1));
+                WriteBigEndian(output, (ulong)count, 4);
+            }
+        }
+
+        private static void WriteString(Stream output, string value)
+        {
+            byte[] bytes = Encoding.UTF8.GetBytes(value);
+            if (bytes.Length < 32)
+            {
+                output.WriteByte((byte)(0xa0 | bytes.Length));
+            }
+            else if (bytes.Length <= byte.MaxValue)
+            {
+                output.WriteByte(0xd9);
+                output.WriteByte((byte)bytes.Length);
+            }
+            else if (bytes.Length <= ushort.MaxValue)
+            {
+                output.WriteByte(0xda);
+                WriteBigEndian(output, (ulong)bytes.Length, 2);
+            }
+            else
+            {
+                output.WriteByte(0xdb);
+                WriteBigEndian(output, (ulong)bytes.Length, 4);
+            }
+            output.Write(bytes, 0, bytes.Length);
+        }
+
+        private static void WriteInteger(Stream output, long value)
+        {
+            if (value >= 0 && value < 128)
+            {
+                output.WriteByte((byte)value);
+            }
+            else if (value < 0 && value >= -32)
+            {
+                output.WriteByte((byte)(sbyte)value);
+            }
+            else if (value >= int.MinValue && value <= int.MaxValue)
+            {
+                output.WriteByte(0xd2);
+                WriteBigEndian(output, (ulong)(uint)(int)value, 4);
+            }
+            else
+            {
+                output.WriteByte(0xd3);
+                WriteBigEndian(output, (ulong)value, 8);
+            }
+        }
+
+        private static void WriteUInt64(Stream output, ulong value)
+        {
+            output.WriteByte(0xcf);
+            WriteBigEndian(output, value, 8);
+        }
+
+        private static void WriteDouble(Stream output, double value)
+        {
+            output.WriteByte(0xcb);
+            WriteBigEndian(output, (ulong)BitConverter.DoubleToInt64Bits(value), 8);
+        }
+
+        private static void WriteBigEndian(Stream output, ulong value, int size)
+        {
+            for (int shift = (size - 1) * 8; shift >= 0; shift -= 8)
+                output.WriteByte((byte)(value >> shift));
+        }
+
+        private sealed class Reader
+        {
+            private readonly byte[] data;
+            private readonly int end;
+            public int Position;
+
+            public Reader(byte[] data, int offset, int end)
+            {
+                this.data = data;
+                this.end = end;
+                Position = offset;
+            }
+
+            public void CopyValue(JsonWriter writer)
+            {
+                byte prefix = ReadByte();
+                if (prefix <= 0x7f)
+                {
+                    writer.WriteValue((long)prefix);
+                }
+                else if (prefix <= 0x8f)
+                {
+                    CopyMap(writer, prefix & 0x0f);
+                }
+                else if (prefix <= 0x9f)
+                {
+                    CopyArray(writer, prefix & 0x0f);
+                }
+                else if (prefix <= 0xbf)
+                {
+                    writer.WriteValue(ReadString(prefix & 0x1f));
+                }
+                else if (prefix >= 0xe0)
+                {
+                    writer.WriteValue((long)(sbyte)prefix);
+                }
+                else
+                {
+                    switch (prefix)
+                    {
+                        case 0xc0: writer.WriteNull(); break;
+                        case 0xc2: writer.WriteValue(false); break;
+                        case 0xc3: writer.WriteValue(true); break;
+                        case 0xc4: writer.WriteValue(ReadBytes((int)ReadBigEndian(1))); break;
+                        case 0xc5: writer.WriteValue(ReadBytes((int)ReadBigEndian(2))); break;
+                        case 0xc6: writer.WriteValue(ReadBytes(ReadLength())); break;
+                        case 0xca: writer.WriteValue(BitConverter.ToSingle(BitConverter.GetBytes((int)ReadBigEndian(4)), 0)); break;
+                        case 0xcb: writer.WriteValue(BitConverter.Int64BitsToDouble((long)ReadBigEndian(8))); break;
+                        case 0xcc: writer.WriteValue((long)ReadBigEndian(1)); break;
+                        case 0xcd: writer.WriteValue((long)ReadBigEndian(2)); break;
+                        case 0xce: writer.WriteValue((long)ReadBigEndian(4)); break;
+                        case 0xcf: writer.WriteValue(ReadBigEndian(8)); break;
+                        case 0xd0: writer.WriteValue((long)(sbyte)ReadBigEndian(1)); break;
+                        case 0xd1: writer.WriteValue((long)(short)ReadBigEndian(2)); break;
+                        case 0xd2: writer.WriteValue((long)(int)ReadBigEndian(4)); break;
+                        case 0xd3: writer.WriteValue((long)ReadBigEndian(8)); break;
+                        case 0xd9: writer.WriteValue(ReadString((int)ReadBigEndian(1))); break;
+                        case 0xda: writer.WriteValue(ReadString((int)ReadBigEndian(2))); break;
+                        case 0xdb: writer.WriteValue(ReadString(ReadLength())); break;
+                        case 0xdc: CopyArray(writer, (int)ReadBigEndian(2)); break;
+                        case 0xdd: CopyArray(writer, ReadLength()); break;
+                        case 0xde: CopyMap(writer, (int)ReadBigEndian(2)); break;
+                        case 0xdf: CopyMap(writer, ReadLength()); break;
+                        default: throw new InvalidDataException($"Unsupported MessagePack type 0x{prefix:x2}");
+                    }
+                }
+            }
+
+            private void CopyMap(JsonWriter writer, int count)
+            {
+                writer.WriteStartObject();
+                for (int i = 0; i < count; i++)
+                {
+                    byte prefix = ReadByte();
+                    int length = prefix >= 0xa0 && prefix <= 0xbf ? prefix & 0x1f
+                        : prefix == 0xd9 ? (int)ReadBigEndian(1)
+                        : prefix == 0xda ? (int)ReadBigEndian(2)
+                        : prefix == 0xdb ? ReadLength()
+                        : throw new InvalidDataException("MessagePack map keys must be strings");
+                    writer.WritePropertyName(ReadString(length));
+                    CopyValue(writer);
+                }
+                writer.WriteEndObject();
+            }
+
+            private void CopyArray(JsonWriter writer, int count)
+            {
+                writer.WriteStartArray();
+                for (int i = 0; i < count; i++)
+                    CopyValue(writer);
+                writer.WriteEndArray();
+            }
+
+            private byte ReadByte()
+            {
+                Require(1);
+                return data[Position++];
+            }
+
+            private int ReadLength()
+            {
+                ulong length = ReadBigEndian(4);
+                if (length > int.MaxValue)
+                    throw new InvalidDataException($"MessagePack length {length} is too large");
+                return (int)length;
+            }
+
+            private ulong ReadBigEndian(int size)
+            {
+                Require(size);
+                ulong value = 0;
+                for (int i = 0; i < size; i++)
+                    value = (value << 8) | data[Position++];
+                return value;
+            }
+
+            private string ReadString(int length)
+            {
+                Require(length);
+                string value = Encoding.UTF8.GetString(data, Position, length);
+                Position += length;
+                return value;
+            }
+
+            private byte[] ReadBytes(int length)
+            {
+                Require(length);
+                var value = new byte[length];
+                Buffer.BlockCopy(data, Position, value, 0, length);
+                Position += length;
+                return value;
+            }
+
+            private void Require(int count)
+            {
+                if (count < 0 || end - Position < count)
+                    throw new InvalidDataException("Truncated MessagePack value");
+            }
+        }
+    }
+}
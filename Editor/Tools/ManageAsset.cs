@@ -897,7 +897,7 @@ namespace UnityMCP.Editor.Tools
             string guid = AssetDatabase.AssetPathToGUID(path);
             Type assetType = AssetDatabase.GetMainAssetTypeAtPath(path);
             UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(path);
-            string previewBase64 = null;
+            byte[] previewPng = null;
             int previewWidth = 0;
             int previewHeight = 0;
 
@@ -921,7 +921,7 @@ namespace UnityMCP.Editor.Tools
                          RenderTexture.ReleaseTemporary(rt);
 
                          byte[] pngData = readablePreview.EncodeToPNG();
-                         previewBase64 = Convert.ToBase64String(pngData);
+                         previewPng = pngData;
                          previewWidth = readablePreview.width;
                          previewHeight = readablePreview.height;
                          UnityEngine.Object.DestroyImmediate(readablePreview); // Clean up temp texture
@@ -949,7 +949,7 @@ namespace UnityMCP.Editor.Tools
                 instanceID = asset?.GetInstanceID() ?? 0,
                 lastWriteTimeUtc = File.GetLastWriteTimeUtc(Path.Combine(Directory.GetCurrentDirectory(), path)).ToString("o"), // ISO 8601
                 // --- Preview Data ---
-                 previewBase64 = previewBase64, // PNG data as Base64 string
+                 previewBase64 = previewPng, // PNG data: a binary attachment, or a Base64 string for clients without attachments
                  previewWidth = previewWidth,
                  previewHeight = previewHeight
                  // TODO: Add more metadata? Importer settings? Dependencies?
@@ -25,13 +25,13 @@ namespace UnityMCP.Editor.Tools
             string path = @params["path"]?.ToString(); // Relative to Assets/
             string contents = null;
             
-            // Check if we have base64 encoded contents
+            // Check if we have encoded contents (raw UTF-8 bytes, or base64 from older clients)
             bool contentsEncoded = @params["contentsEncoded"]?.ToObject<bool>() ?? false;
             if (contentsEncoded && @params["encodedContents"] != null)
             {
                 try
                 {
-                    contents = DecodeBase64(@params["encodedContents"].ToString());
+                    contents = DecodeContents(@params["encodedContents"]);
                 }
                 catch (Exception e)
                 {
@@ -113,23 +113,16 @@ namespace UnityMCP.Editor.Tools
         }
 
         /// <summary>
-        /// Decode base64 string to normal text
+        /// Decode UTF-8 script contents sent as bytes (a binary attachment) or as a base64 string
         /// </summary>
-        private static string DecodeBase64(string encoded)
+        private static string DecodeContents(JToken encoded)
         {
-            byte[] data = Convert.FromBase64String(encoded);
+            byte[] data = encoded.Type == JTokenType.Bytes
+                ? (byte[])((JValue)encoded).Value
+                : Convert.FromBase64String(encoded.ToString());
             return System.Text.Encoding.UTF8.GetString(data);
         }
 
-        /// <summary>
-        /// Encode text to base64 string
-        /// </summary>
-        private static string EncodeBase64(string text)
-        {
-            byte[] data = System.Text.Encoding.UTF8.GetBytes(text);
-            return Convert.ToBase64String(data);
-        }
-
         private static object CreateScript(string fullPath, string relativePath, string name, string contents, string scriptType, string namespaceName)
         {
             // Check if script already exists
@@ -176,13 +169,13 @@ namespace UnityMCP.Editor.Tools
             {
                 string contents = File.ReadAllText(fullPath);
                 
-                // Return both normal and encoded contents for larger files
-                bool isLarge = contents.Length > 10000; // If content is large, include encoded version
+                // Large files go back as UTF-8 bytes: a binary attachment where the client
+                // negotiated one, a base64 string otherwise
+                bool isLarge = contents.Length > 10000;
                 var responseData = new {
                     path = relativePath, 
-                    contents = contents,
-                    // For large files, also include base64-encoded version
-                    encodedContents = isLarge ? EncodeBase64(contents) : null,
+                    contents = isLarge ? null : contents,
+                    encodedContents = isLarge ? System.Text.Encoding.UTF8.GetBytes(contents) : null,
                     contentsEncoded = isLarge
                 };
                 
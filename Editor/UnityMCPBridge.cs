@@ -3,12 +3,15 @@ using System.Collections.Generic;
 using System.Linq;
 using System.Net;
 using System.Net.Sockets;
+using System.Threading;
 using System.Threading.Tasks;
 using UnityEditor;
 using UnityEngine;
 using Newtonsoft.Json;
 using Newtonsoft.Json.Linq;
 using System.IO;
+using System.IO.Compression;
+using UnityMCP.Editor.Helpers;
 using UnityMCP.Editor.Models;
 using UnityMCP.Editor.Tools;
 
@@ -18,12 +21,47 @@ namespace UnityMCP.Editor
     public static partial class UnityMCPBridge
     {
         private static TcpListener listener;
+#if UNITY_2021_2_OR_NEWER
+        // Same-host clients may connect over a Unix domain socket instead of TCP
+        private static Socket unixListener;
+        public static string UnixSocketPath => Path.Combine(Path.GetTempPath(), $"unity-mcp-{unityPort}.sock");
+#endif
         private static bool isRunning = false;
         private static readonly object lockObj = new();
-        private static Dictionary<string, (string commandJson, TaskCompletionSource<string> tcs)> commandQueue = new();
-        private static readonly int unityPort = 6400;  // Hardcoded port
+        // FIFO so commands pipelined on one connection execute in the order they were sent
+        // Attachment lists are null unless the connection negotiated binary attachments
+        private static readonly Queue<(string commandJson, TaskCompletionSource<string> tcs, List<byte[]> received, List<byte[]> outgoing)> commandQueue = new();
+        // Several editors can run on one machine: each takes the first free port from DefaultPort
+        private const int DefaultPort = 6400;
+        private const int PortRange = 10;
+        private static int unityPort = DefaultPort;
+        // Identifies this editor to clients that connect to several; captured on the main thread
+        private static object editorInfo;
+
+        // Length-prefixed framing, negotiated per connection via a "handshake" command.
+        // Frame header: payload length (big-endian uint32) followed by a flags byte.
+        private const int ProtocolVersion = 1;
+        private const int FrameHeaderSize = 5;
+        private const int MaxFrameSize = int.MaxValue;
+        // Flag: the payload is raw DEFLATE, applied to messages above the client's threshold
+        private const byte FlagCompressed = 0x01;
+        // Flag: the payload is raw bytes referenced as {"$attachment": n} by the next message frame
+        private const byte FlagAttachment = 0x02;
+        // Flag: the payload follows in chunks, each acknowledged with an empty FlagAck frame
+        private const byte FlagChunked = 0x04;
+        private const byte FlagAck = 0x08;
+        private static readonly byte[] AckFrame = { 0, 0, 0, 0, FlagAck };
+        // Flag: the payload is NDJSON, a header line naming the request followed by result records.
+        // Records frames of a streamed response precede its trailer, the ordinary response frame,
+        // in which the streamed list is replaced by {"$records": count}. On a command frame, the
+        // flag asks for the command's list-shaped result to be streamed.
+        private const byte FlagRecords = 0x10;
+        private const int RecordFrameSize = 64 * 1024;
+        // Optional protocol features a client may request in its handshake
+        private static readonly string[] SupportedFeatures = { "multiplex", "compress", "msgpack", "attachments", "chunked", "stream", "batch" };
 
         public static bool IsRunning => isRunning;
+        public static int Port => unityPort;
 
         public static bool FolderExists(string path)
         {
@@ -46,11 +84,40 @@ namespace UnityMCP.Editor
         public static void Start()
         {
             if (isRunning) return;
+            listener = null;
+            for (int port = DefaultPort; port < DefaultPort + PortRange && listener == null; port++)
+            {
+                try
+                {
+                    listener = new TcpListener(IPAddress.Loopback, port);
+                    listener.Start();
+                    unityPort = port;
+                }
+                catch (SocketException ex) when (ex.SocketErrorCode == SocketError.AddressAlreadyInUse)
+                {
+                    listener = null; // Another editor has this port
+                }
+            }
+            if (listener == null)
+            {
+                Debug.LogError($"UnityMCPBridge could not start: ports {DefaultPort}-{DefaultPort + PortRange - 1} are all in use.");
+                return;
+            }
             isRunning = true;
-            listener = new TcpListener(IPAddress.Loopback, unityPort);
-            listener.Start();
+            string projectPath = Path.GetDirectoryName(Application.dataPath);
+            editorInfo = new
+            {
+                project = Path.GetFileName(projectPath),
+                path = projectPath,
+                productName = Application.productName,
+                unityVersion = Application.unityVersion,
+                port = unityPort
+            };
             Debug.Log($"UnityMCPBridge started on port {unityPort}.");
             Task.Run(ListenerLoop);
+#if UNITY_2021_2_OR_NEWER
+            StartUnixListener();
+#endif
             EditorApplication.update += ProcessCommands;
         }
 
@@ -59,6 +126,9 @@ namespace UnityMCP.Editor
             if (!isRunning) return;
             isRunning = false;
             listener.Stop();
+#if UNITY_2021_2_OR_NEWER
+            StopUnixListener();
+#endif
             EditorApplication.update -= ProcessCommands;
             Debug.Log("UnityMCPBridge stopped.");
         }
@@ -72,12 +142,14 @@ namespace UnityMCP.Editor
                     var client = await listener.AcceptTcpClientAsync();
                     // Enable basic socket keepalive
                     client.Client.SetSocketOption(SocketOptionLevel.Socket, SocketOptionName.KeepAlive, true);
+                    // Upload acknowledgements are tiny; Nagle would hold them back behind the previous one
+                    client.NoDelay = true;
 
                     // Set longer receive timeout to prevent quick disconnections
                     client.ReceiveTimeout = 60000; // 60 seconds
 
                     // Fire and forget each client connection
-                    _ = HandleClientAsync(client);
+                    _ = HandleClientAsync(client, client.GetStream());
                 }
                 catch (Exception ex)
                 {
@@ -86,40 +158,147 @@ namespace UnityMCP.Editor
             }
         }
 
-        private static async Task HandleClientAsync(TcpClient client)
+#if UNITY_2021_2_OR_NEWER
+        private static void StartUnixListener()
+        {
+            try
+            {
+                // A socket file left behind by a crashed editor would make Bind fail
+                File.Delete(UnixSocketPath);
+                unixListener = new Socket(AddressFamily.Unix, SocketType.Stream, ProtocolType.Unspecified);
+                unixListener.Bind(new UnixDomainSocketEndPoint(UnixSocketPath));
+                unixListener.Listen(16);
+                Debug.Log($"UnityMCPBridge listening on {UnixSocketPath}.");
+                Task.Run(UnixListenerLoop);
+            }
+            catch (Exception ex)
+            {
+                // TCP keeps working; only the local socket option is unavailable
+                Debug.LogWarning($"Unix socket listener unavailable: {ex.Message}");
+                unixListener?.Dispose();
+                unixListener = null;
+            }
+        }
+
+        private static void StopUnixListener()
+        {
+            if (unixListener == null) return;
+            unixListener.Dispose();
+            unixListener = null;
+            try
+            {
+                File.Delete(UnixSocketPath);
+            }
+            catch (IOException)
+            {
+                // Removed again on the next start
+            }
+        }
+
+        private static async Task UnixListenerLoop()
+        {
+            var socket = unixListener;
+            while (isRunning && socket == unixListener)
+            {
+                try
+                {
+                    var client = await socket.AcceptAsync();
+                    _ = HandleClientAsync(client, new NetworkStream(client, true));
+                }
+                catch (Exception ex)
+                {
+                    if (isRunning && socket == unixListener) Debug.LogError($"Unix socket listener error: {ex.Message}");
+                }
+            }
+        }
+#endif
+
+        // Per-connection protocol state, negotiated through the handshake
+        private sealed class ClientSession
+        {
+            public bool Framed;
+            public readonly HashSet<string> Features = new();
+            // Multiplexed responses complete out of order and must not interleave on the stream
+            public readonly SemaphoreSlim WriteLock = new(1, 1);
+            // Responses at least this large are deflated when compression was negotiated
+            public int CompressionThreshold;
+            public CompressionLevel CompressionLevel = CompressionLevel.Fastest;
+
+            public bool Multiplexed => Features.Contains("multiplex");
+            public bool Compressed => Features.Contains("compress") && CompressionThreshold > 0;
+            // Frames carry MessagePack instead of JSON text
+            public bool Binary => Features.Contains("msgpack");
+            // Chunked uploads are acknowledged every UploadChunkSize bytes
+            public int UploadChunkSize;
+
+            // byte[] values travel as attachment frames instead of base64 strings
+            public bool Attachments => Features.Contains("attachments");
+            public bool Chunked => Features.Contains("chunked") && UploadChunkSize > 0;
+            // List-shaped results may be sent as records frames ahead of the response
+            public bool Streamed => Features.Contains("stream");
+        }
+
+        private static async Task HandleClientAsync(IDisposable client, NetworkStream stream)
         {
             using (client)
-            using (var stream = client.GetStream())
+            using (stream)
             {
                 var buffer = new byte[8192];
+                // Connections start in legacy mode (one ReadAsync == one command) and switch to
+                // length-prefixed frames once the client completes the handshake.
+                var session = new ClientSession();
                 while (isRunning)
                 {
                     try
                     {
-                        int bytesRead = await stream.ReadAsync(buffer, 0, buffer.Length);
-                        if (bytesRead == 0) break; // Client disconnected
+                        string commandText;
+                        List<byte[]> received = null;
+                        bool streamed = false;
+                        if (session.Framed)
+                        {
+                            (commandText, received, streamed) = await ReadFrameAsync(stream, session);
+                            if (commandText == null) break; // Client disconnected
+                        }
+                        else
+                        {
+                            int bytesRead = await stream.ReadAsync(buffer, 0, buffer.Length);
+                            if (bytesRead == 0) break; // Client disconnected
+
+                            commandText = System.Text.Encoding.UTF8.GetString(buffer, 0, bytesRead);
+                        }
 
-                        string commandText = System.Text.Encoding.UTF8.GetString(buffer, 0, bytesRead);
-                        string commandId = Guid.NewGuid().ToString();
                         var tcs = new TaskCompletionSource<string>();
 
                         // Special handling for ping command to avoid JSON parsing
                         if (commandText.Trim() == "ping")
                         {
                             // Direct response to ping without going through JSON parsing
-                            byte[] pingResponseBytes = System.Text.Encoding.UTF8.GetBytes("{\"status\":\"success\",\"result\":{\"message\":\"pong\"}}");
-                            await stream.WriteAsync(pingResponseBytes, 0, pingResponseBytes.Length);
+                            await SendAsync(stream, session, "{\"status\":\"success\",\"result\":{\"message\":\"pong\"}}");
+                            continue;
+                        }
+
+                        // Protocol negotiation is answered unframed, then the connection switches over
+                        if (!session.Framed && TryHandleHandshake(commandText, session, out string handshakeResponse))
+                        {
+                            await WriteMessageAsync(stream, handshakeResponse, false);
                             continue;
                         }
 
+                        var outgoing = session.Attachments ? new List<byte[]>() : null;
                         lock (lockObj)
                         {
-                            commandQueue[commandId] = (commandText, tcs);
+                            commandQueue.Enqueue((commandText, tcs, received, outgoing));
+                        }
+
+                        if (session.Multiplexed)
+                        {
+                            // Keep reading so pipelined commands queue up for the same editor frame
+                            _ = RespondWhenCompleteAsync(stream, session, tcs.Task, ExtractCommandId(commandText), outgoing, streamed);
+                            continue;
                         }
 
                         string response = await tcs.Task;
-                        byte[] responseBytes = System.Text.Encoding.UTF8.GetBytes(response);
-                        await stream.WriteAsync(responseBytes, 0, responseBytes.Length);
+                        await SendAsync(stream, session, response, outgoing, null, streamed);
                     }
                     catch (Exception ex)
                     {
@@ -130,16 +309,409 @@ namespace UnityMCP.Editor
             }
         }
 
+        // Checks whether the command is a protocol handshake and builds the reply if it is
+        private static bool TryHandleHandshake(string commandText, ClientSession session, out string response)
+        {
+            response = null;
+            if (!commandText.Contains("\"handshake\"") || !IsValidJson(commandText))
+                return false;
+
+            var command = JsonConvert.DeserializeObject<Command>(commandText);
+            if (command?.type != "handshake")
+                return false;
+
+            int requested = command.@params?["version"]?.ToObject<int>() ?? 0;
+            if (requested != ProtocolVersion)
+            {
+                response = JsonConvert.SerializeObject(new
+                {
+                    status = "error",
+                    error = $"Unsupported protocol version: {requested}"
+                });
+                return true;
+            }
+
+            var features = command.@params?["features"]?.ToObject<string[]>() ?? Array.Empty<string>();
+            session.Framed = true;
+            session.Features.UnionWith(features.Intersect(SupportedFeatures));
+            if (command.@params?["compression"] is JObject compression)
+            {
+                session.CompressionThreshold = compression["threshold"]?.ToObject<int>() ?? 0;
+                // DeflateStream only offers coarse levels; zlib levels 6 and up ask for a smaller result
+                int level = compression["level"]?.ToObject<int>() ?? 1;
+                session.CompressionLevel = level >= 6 ? CompressionLevel.Optimal : CompressionLevel.Fastest;
+            }
+            if (command.@params?["upload"] is JObject upload)
+            {
+                session.UploadChunkSize = upload["chunkSize"]?.ToObject<int>() ?? 0;
+            }
+            response = JsonConvert.SerializeObject(new
+            {
+                status = "success",
+                result = new { version = ProtocolVersion, features = session.Features.ToArray(), editor = editorInfo }
+            });
+            return true;
+        }
+
+        // Multiplexed commands carry an "id" as their first property, echoed back in the response
+        private static string ExtractCommandId(string commandText)
+        {
+            try
+            {
+                using var reader = new JsonTextReader(new StringReader(commandText));
+                while (reader.Read())
+                {
+                    if (reader.TokenType == JsonToken.PropertyName && reader.Depth == 1)
+                    {
+                        if ((string)reader.Value == "id")
+                            return reader.ReadAsString();
+                        reader.Skip();
+                    }
+                }
+            }
+            catch (JsonException)
+            {
+                // Invalid JSON is reported by ProcessCommands; the response just goes out untagged
+            }
+            return null;
+        }
+
+        private static async Task RespondWhenCompleteAsync(NetworkStream stream, ClientSession session, Task<string> pending, string id, List<byte[]> attachments, bool streamed)
+        {
+            try
+            {
+                string response = await pending;
+                await SendAsync(stream, session, response, attachments, id, streamed);
+            }
+            catch (Exception ex)
+            {
+                // The client disconnected while the command was running
+                Debug.LogWarning($"Could not deliver response: {ex.Message}");
+            }
+        }
+
+        private static async Task SendAsync(NetworkStream stream, ClientSession session, string message, List<byte[]> attachments = null, string id = null, bool streamed = false)
+        {
+            await session.WriteLock.WaitAsync();
+            try
+            {
+                // Records are split out of the serialized response here, off the main thread,
+                // and go out as they are found. Responses carrying attachments are sent whole.
+                if (streamed && session.Streamed && (attachments == null || attachments.Count == 0))
+                {
+                    message = await WriteRecordsAsync(stream, session, message, id);
+                }
+                await WriteMessageAsync(stream, TagResponse(message, id), session.Framed, session, attachments);
+            }
+            finally
+            {
+                session.WriteLock.Release();
+            }
+        }
+
+        // Multiplexed responses carry the command's "id" as their first property
+        private static string TagResponse(string response, string id)
+        {
+            if (id == null || !response.StartsWith("{"))
+                return response;
+            return "{\"id\":" + JsonConvert.ToString(id) + (response.Length > 2 ? "," : "") + response.Substring(1);
+        }
+
+        // Sends the records of a response's list-shaped result in NDJSON frames of about
+        // RecordFrameSize, and returns the trailer; responses without such a list are returned as is
+        private static async Task<string> WriteRecordsAsync(NetworkStream stream, ClientSession session, string response, string id)
+        {
+            int open = FindRecords(response);
+            if (open < 0) return response;
+
+            var batch = new System.Text.StringBuilder();
+            batch.Append(TagResponse("{}", id)).Append('\n');
+            int headerLength = batch.Length;
+            int count = 0;
+            int position = SkipWhitespace(response, open + 1);
+            while (position < response.Length && response[position] != ']')
+            {
+                int end = SkipValue(response, position);
+                batch.Append(response, position, end - position).Append('\n');
+                count++;
+                position = SkipWhitespace(response, end);
+                if (position < response.Length && response[position] == ',')
+                    position = SkipWhitespace(response, position + 1);
+
+                if (batch.Length >= RecordFrameSize)
+                {
+                    await WriteRecordFrameAsync(stream, session, batch);
+                    batch.Length = headerLength;
+                }
+            }
+            if (batch.Length > headerLength)
+                await WriteRecordFrameAsync(stream, session, batch);
+            return response.Substring(0, open) + "{\"$records\":" + count + "}" + response.Substring(position + 1);
+        }
+
+        private static async Task WriteRecordFrameAsync(NetworkStream stream, ClientSession session, System.Text.StringBuilder batch)
+        {
+            string text = batch.ToString();
+            var frame = new byte[FrameHeaderSize + System.Text.Encoding.UTF8.GetByteCount(text)];
+            System.Text.Encoding.UTF8.GetBytes(text, 0, text.Length, frame, FrameHeaderSize);
+            await WriteFrameAsync(stream, frame, FlagRecords, session);
+        }
+
+        // Finds the '[' of the list a response streams: its result's data if that is an array,
+        // else the first array among data's properties. Returns -1 if there is none.
+        private static int FindRecords(string response)
+        {
+            using var reader = new JsonTextReader(new StringReader(response));
+            while (reader.Read())
+            {
+                if (reader.TokenType != JsonToken.PropertyName)
+                    continue;
+                if (reader.Depth == 1 && (string)reader.Value != "result")
+                {
+                    reader.Skip();
+                    continue;
+                }
+                if (reader.Depth == 2 && (string)reader.Value != "data")
+                {
+                    reader.Skip();
+                    continue;
+                }
+                if (reader.Depth == 3)
+                {
+                    // Only reached inside an object under "data"
+                    reader.Read();
+                    if (reader.TokenType == JsonToken.StartArray)
+                        return reader.LinePosition - 1;
+                    reader.Skip();
+                    continue;
+                }
+                if (reader.Depth == 2)
+                {
+                    reader.Read();
+                    if (reader.TokenType == JsonToken.StartArray)
+                        return reader.LinePosition - 1;
+                    if (reader.TokenType != JsonToken.StartObject)
+                        return -1;
+                }
+            }
+            return -1;
+        }
+
+        private static int SkipWhitespace(string json, int position)
+        {
+            while (position < json.Length && char.IsWhiteSpace(json[position]))
+                position++;
+            return position;
+        }
+
+        // Returns the index just past the JSON value starting at `position`
+        private static int SkipValue(string json, int position)
+        {
+            int depth = 0;
+            bool inString = false;
+            for (; position < json.Length; position++)
+            {
+                char c = json[position];
+                if (inString)
+                {
+                    if (c == '\\')
+                        position++;
+                    else if (c == '"')
+                    {
+                        inString = false;
+                        if (depth == 0) return position + 1;
+                    }
+                    continue;
+                }
+                switch (c)
+                {
+                    case '"':
+                        inString = true;
+                        break;
+                    case '{':
+                    case '[':
+                        depth++;
+                        break;
+                    case '}':
+                    case ']':
+                        if (depth == 0) return position;
+                        if (--depth == 0) return position + 1;
+                        break;
+                    case ',':
+                        if (depth == 0) return position;
+                        break;
+                }
+            }
+            return position;
+        }
+
+        // Reads one message frame along with the attachment frames sent ahead of it, and whether
+        // the message asked for its result to be streamed; returns a null message if the client disconnected
+        private static async Task<(string message, List<byte[]> attachments, bool streamed)> ReadFrameAsync(NetworkStream stream, ClientSession session)
+        {
+            List<byte[]> attachments = null;
+            while (true)
+            {
+                byte[] header = await ReadExactlyAsync(stream, FrameHeaderSize);
+                if (header == null) return (null, null, false);
+
+                int length = (header[0] << 24) | (header[1] << 16) | (header[2] << 8) | header[3];
+                if (length < 0 || length > MaxFrameSize)
+                    throw new InvalidDataException($"Invalid frame length: {length}");
+
+                byte[] payload;
+                if ((header[4] & FlagChunked) != 0 && session.Chunked)
+                {
+                    payload = await ReadChunkedAsync(stream, session, length);
+                }
+                else
+                {
+                    payload = await ReadExactlyAsync(stream, length);
+                }
+                if (payload == null) return (null, null, false);
+
+                if ((header[4] & FlagCompressed) != 0)
+                {
+                    using var inflated = new MemoryStream();
+                    using (var deflate = new DeflateStream(new MemoryStream(payload), CompressionMode.Decompress))
+                    {
+                        deflate.CopyTo(inflated);
+                    }
+                    payload = inflated.ToArray();
+                }
+                if ((header[4] & FlagAttachment) != 0)
+                {
+                    (attachments ??= new List<byte[]>()).Add(payload);
+                    continue;
+                }
+                bool streamed = (header[4] & FlagRecords) != 0;
+                if (session.Binary)
+                    return (MessagePackTranscoder.ToJson(payload, 0, payload.Length), attachments, streamed);
+                return (System.Text.Encoding.UTF8.GetString(payload), attachments, streamed);
+            }
+        }
+
+        private static async Task<byte[]> ReadExactlyAsync(NetworkStream stream, int count)
+        {
+            var data = new byte[count];
+            return await ReadIntoAsync(stream, data, 0, count) ? data : null;
+        }
+
+        // Reads a chunked upload straight into its final buffer, acknowledging each chunk so the
+        // client sends the next; the client never has more than its window of chunks in flight
+        private static async Task<byte[]> ReadChunkedAsync(NetworkStream stream, ClientSession session, int length)
+        {
+            var data = new byte[length];
+            for (int offset = 0; offset < length; offset += session.UploadChunkSize)
+            {
+                int count = Math.Min(session.UploadChunkSize, length - offset);
+                if (!await ReadIntoAsync(stream, data, offset, count)) return null;
+
+                await session.WriteLock.WaitAsync();
+                try
+                {
+                    await stream.WriteAsync(AckFrame, 0, AckFrame.Length);
+                }
+                finally
+                {
+                    session.WriteLock.Release();
+                }
+            }
+            return data;
+        }
+
+        private static async Task<bool> ReadIntoAsync(NetworkStream stream, byte[] data, int offset, int count)
+        {
+            int end = offset + count;
+            while (offset < end)
+            {
+                int bytesRead = await stream.ReadAsync(data, offset, end - offset);
+                if (bytesRead == 0) return false;
+                offset += bytesRead;
+            }
+            return true;
+        }
+
+        private static async Task WriteMessageAsync(NetworkStream stream, string message, bool framed, ClientSession session = null, List<byte[]> attachments = null)
+        {
+            if (!framed)
+            {
+                byte[] bytes = System.Text.Encoding.UTF8.GetBytes(message);
+                await stream.WriteAsync(bytes, 0, bytes.Length);
+                return;
+            }
+
+            if (attachments != null)
+            {
+                foreach (byte[] attachment in attachments)
+                {
+                    var attachmentFrame = new byte[FrameHeaderSize + attachment.Length];
+                    Buffer.BlockCopy(attachment, 0, attachmentFrame, FrameHeaderSize, attachment.Length);
+                    await WriteFrameAsync(stream, attachmentFrame, FlagAttachment, session);
+                }
+            }
+
+            // Header and payload go out in a single write so Nagle never holds back the payload
+            byte[] frame;
+            if (session != null && session.Binary)
+            {
+                frame = MessagePackTranscoder.FromJson(message, FrameHeaderSize);
+            }
+            else
+            {
+                frame = new byte[FrameHeaderSize + System.Text.Encoding.UTF8.GetByteCount(message)];
+                System.Text.Encoding.UTF8.GetBytes(message, 0, message.Length, frame, FrameHeaderSize);
+            }
+            await WriteFrameAsync(stream, frame, 0, session);
+        }
+
+        // Writes a frame buffer whose first FrameHeaderSize bytes are reserved for the header
+        private static async Task WriteFrameAsync(NetworkStream stream, byte[] frame, byte flags, ClientSession session)
+        {
+            int length = frame.Length - FrameHeaderSize;
+            SetFrameHeader(frame, length, flags);
+
+            if (session != null && session.Compressed && length >= session.CompressionThreshold)
+            {
+                byte[] compressed = Deflate(frame, FrameHeaderSize, length, session.CompressionLevel);
+                if (compressed.Length < frame.Length)
+                {
+                    frame = compressed;
+                    SetFrameHeader(frame, frame.Length - FrameHeaderSize, (byte)(flags | FlagCompressed));
+                }
+            }
+            await stream.WriteAsync(frame, 0, frame.Length);
+        }
+
+        private static void SetFrameHeader(byte[] frame, int length, byte flags)
+        {
+            frame[0] = (byte)(length >> 24);
+            frame[1] = (byte)(length >> 16);
+            frame[2] = (byte)(length >> 8);
+            frame[3] = (byte)length;
+            frame[4] = flags;
+        }
+
+        // Returns a frame buffer with room for the header followed by the deflated payload
+        private static byte[] Deflate(byte[] data, int offset, int count, CompressionLevel level)
+        {
+            using var output = new MemoryStream();
+            output.SetLength(FrameHeaderSize);
+            output.Position = FrameHeaderSize;
+            using (var deflate = new DeflateStream(output, level, true))
+            {
+                deflate.Write(data, offset, count);
+            }
+            return output.ToArray();
+        }
+
         private static void ProcessCommands()
         {
-            List<string> processedIds = new();
             lock (lockObj)
             {
-                foreach (var kvp in commandQueue.ToList())
+                while (commandQueue.Count > 0)
                 {
-                    string id = kvp.Key;
-                    string commandText = kvp.Value.commandJson;
-                    var tcs = kvp.Value.tcs;
+                    var (commandText, tcs, received, outgoing) = commandQueue.Dequeue();
 
                     try
                     {
@@ -152,7 +724,6 @@ namespace UnityMCP.Editor
                                 error = "Empty command received"
                             };
                             tcs.SetResult(JsonConvert.SerializeObject(emptyResponse));
-                            processedIds.Add(id);
                             continue;
                         }
 
@@ -168,7 +739,6 @@ namespace UnityMCP.Editor
                                 result = new { message = "pong" }
                             };
                             tcs.SetResult(JsonConvert.SerializeObject(pingResponse));
-                            processedIds.Add(id);
                             continue;
                         }
 
@@ -182,7 +752,6 @@ namespace UnityMCP.Editor
                                 receivedText = commandText.Length > 50 ? commandText.Substring(0, 50) + "..." : commandText
                             };
                             tcs.SetResult(JsonConvert.SerializeObject(invalidJsonResponse));
-                            processedIds.Add(id);
                             continue;
                         }
 
@@ -200,13 +769,16 @@ namespace UnityMCP.Editor
                         }
                         else
                         {
-                            string responseJson = ExecuteCommand(command);
+                            if (received != null && command.@params != null)
+                                AttachmentConverter.Resolve(command.@params, received);
+                            string responseJson = ExecuteCommand(command, outgoing);
                             tcs.SetResult(responseJson);
                         }
                     }
                     catch (Exception ex)
                     {
                         Debug.LogError($"Error processing command: {ex.Message}\n{ex.StackTrace}");
+                        outgoing?.Clear();
 
                         var response = new
                         {
@@ -218,13 +790,6 @@ namespace UnityMCP.Editor
                         string responseJson = JsonConvert.SerializeObject(response);
                         tcs.SetResult(responseJson);
                     }
-
-                    processedIds.Add(id);
-                }
-
-                foreach (var id in processedIds)
-                {
-                    commandQueue.Remove(id);
                 }
             }
         }
@@ -253,8 +818,9 @@ namespace UnityMCP.Editor
             return false;
         }
 
-        private static string ExecuteCommand(Command command)
+        private static string ExecuteCommand(Command command, List<byte[]> attachments = null)
         {
+            int attachmentMark = attachments?.Count ?? 0;
             try
             {
                 if (string.IsNullOrEmpty(command.type))
@@ -278,6 +844,10 @@ namespace UnityMCP.Editor
                 // Use JObject for parameters as the new handlers likely expect this
                 JObject paramsObject = command.@params ?? new JObject();
 
+                // Commands the client coalesced into one batch run back to back in this editor frame
+                if (command.type == "batch")
+                    return ExecuteBatch(paramsObject, attachments);
+
                 // Route command based on the new tool structure from the refactor plan
                 object result = command.type switch
                 {
@@ -295,10 +865,16 @@ namespace UnityMCP.Editor
 
                 // Standard success response format
                 var response = new { status = "success", result };
-                return JsonConvert.SerializeObject(response);
+                if (attachments == null)
+                    return JsonConvert.SerializeObject(response);
+                // byte[] values in the result go out as attachment frames instead of base64
+                return JsonConvert.SerializeObject(response, new AttachmentConverter(attachments));
             }
             catch (Exception ex)
             {
+                // Drop anything collected before serialization failed, keeping earlier batch members' attachments
+                attachments?.RemoveRange(attachmentMark, attachments.Count - attachmentMark);
+
                 // Log the detailed error in Unity for debugging
                 Debug.LogError($"Error executing command '{command?.type ?? "Unknown"}': {ex.Message}\n{ex.StackTrace}");
 
@@ -315,6 +891,24 @@ namespace UnityMCP.Editor
             }
         }
 
+        // Runs each command of a batch and answers with their responses, in order, as one message
+        private static string ExecuteBatch(JObject @params, List<byte[]> attachments)
+        {
+            var responses = new List<string>();
+            foreach (var item in @params["commands"] as JArray ?? new JArray())
+            {
+                var command = (item as JObject)?.ToObject<Command>();
+                if (command == null || command.type == "batch")
+                {
+                    responses.Add(JsonConvert.SerializeObject(new { status = "error", error = "Invalid batch member" }));
+                    continue;
+                }
+                responses.Add(ExecuteCommand(command, attachments));
+            }
+            // Responses are already serialized, so join them rather than parse and re-serialize
+            return "{\"status\":\"success\",\"result\":{\"responses\":[" + string.Join(",", responses) + "]}}";
+        }
+
         // Helper method to get a summary of parameters for error reporting
         private static string GetParamsSummary(JObject @params)
         {
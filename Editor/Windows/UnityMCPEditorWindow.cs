@@ -23,7 +23,7 @@ namespace UnityMCP.Editor.Windows
         private string cursorConfigStatus = "Not configured";
         private string pythonServerStatus = "Not Connected";
         private Color pythonServerStatusColor = Color.red;
-        private const int unityPort = 6400;  // Hardcoded Unity port
+        private static int unityPort => UnityMCPBridge.Port;  // Port the bridge bound, the first free one from 6400
         private const int mcpPort = 6500;    // Hardcoded MCP port
         private const float CONNECTION_CHECK_INTERVAL = 2f; // Check every 2 seconds
         private float lastCheckTime = 0f;
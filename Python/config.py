@@ -3,7 +3,10 @@ Configuration settings for the Unity MCP Server.
 This file contains all configurable parameters for the server.
 """
 
-from dataclasses import dataclass
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 @dataclass
 class ServerConfig:
@@ -13,18 +16,82 @@ class ServerConfig:
     unity_host: str = "localhost"
     unity_port: int = 6400
     mcp_port: int = 6500
+    # "stdio" serves one client per process; "sse" serves many over HTTP on mcp_host:mcp_port,
+    # sharing one set of Unity connections
+    mcp_transport: str = "stdio"
+    mcp_host: str = "127.0.0.1"
+    # "editor" pins each client's selector that matches several editors to the one that first
+    # served it; "none" spreads every read by load
+    session_affinity: str = "none"
+    # Ports probed for running editors; each bridge takes the first free one from 6400
+    editor_ports: List[int] = field(default_factory=lambda: list(range(6400, 6410)))
+    editor_discovery_interval: float = 30.0  # Re-probe editor ports this often when routing by selector
+    discovery_timeout: float = 0.5  # Connect timeout when probing a port for an editor
+    transport: str = "tcp"  # "tcp", or "unix" to reach a same-host bridge over a Unix domain socket
+    # Socket the bridge listens on alongside its TCP port; {port} is the Unity port
+    unix_socket_path: str = os.path.join(tempfile.gettempdir(), "unity-mcp-{port}.sock")
     
     # Connection settings
-    connection_timeout: float = 86400.0  # 24 hours timeout
-    buffer_size: int = 16 * 1024 * 1024  # 16MB buffer
+    connect_timeout: float = 5.0  # Limit for opening a connection and negotiating the protocol
+    startup_wait: float = 10.0  # How long tool calls wait for the connection opened at startup
+    command_timeout: float = 60.0  # Default deadline from sending a command to Unity's answer
+    # Deadlines for command types that legitimately run longer or should fail sooner
+    command_timeouts: Dict[str, float] = field(default_factory=lambda: {
+        "ping": 5.0,
+        "manage_asset": 300.0,  # Imports and searches over large projects
+        "manage_script": 120.0,  # Writing a script can trigger a recompile
+        "execute_menu_item": 300.0,  # Menu items can start builds or bakes
+    })
+    buffer_size: int = 16 * 1024 * 1024  # Largest receive arena kept after a response has been consumed
+    receive_arena_size: int = 256 * 1024  # Initial per-connection receive arena
+    framed_protocol: bool = True  # Negotiate length-prefixed framing with the bridge
+    multiplexing: bool = False  # Pipeline commands tagged with request IDs over one connection
+    # Deflate framed messages at least this many bytes long (0 disables). Loopback is faster
+    # than deflate; around 16 KiB pays off when Unity is across a VM or network boundary.
+    compression_threshold: int = 0
+    compression_level: int = 1  # zlib level for compressed messages, 1 (fastest) to 9 (smallest)
+    codec: str = "json"  # Framed message encoding: "json", or "msgpack" when the msgpack package is installed
+    attachments: bool = True  # Send bytes values as raw frames beside the message instead of base64 text
+    # Stream framed messages larger than this in chunks the bridge acknowledges (0 disables)
+    upload_chunk_size: int = 1024 * 1024
+    upload_window: int = 4  # Unacknowledged upload chunks allowed in flight
+    streaming: bool = True  # Let callers receive list-shaped results record by record as they arrive
+    pool_max_size: int = 4  # Maximum concurrent connections to the bridge
+    # Coalesce pooled commands sent within this many seconds into one batch the bridge
+    # runs in a single editor frame (0 disables)
+    batch_window: float = 0.0
+    batch_max_size: int = 64  # Send a batch early once it holds this many commands
+    singleflight: bool = True  # Let identical read-only commands in flight share one round trip
+    # Commands each priority class may run at once; the pool size caps the total. Keeping
+    # reads and bulk work below it leaves a connection free for interactive polls
+    scheduler_limits: Dict[str, int] = field(default_factory=lambda: {
+        "interactive": 4,  # Editor state and control, console reads
+        "read": 2,  # Read-only queries such as hierarchy dumps and asset searches
+        "bulk": 1,  # Imports, edits and other mutations
+    })
+    scheduler_aging: float = 2.0  # Seconds of waiting that raise a command by one priority class
+    pool_idle_timeout: float = 60.0  # Close pooled connections idle for longer than this
+    health_check_ttl: float = 0.0  # Ping connections idle for longer than this before reuse (0 disables)
+    heartbeat_interval: float = 5.0  # Ping idle connections in the background this often (0 disables)
+    hot_standby: bool = True  # Keep a verified spare connection ready to replace one that dies
     
     # Logging settings
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     # Server settings
-    max_retries: int = 3
-    retry_delay: float = 1.0
+    max_retries: int = 3  # Consecutive connect failures before failing fast
+    retry_delay: float = 1.0  # Initial delay between background reconnect attempts
+    reconnect_max_delay: float = 30.0  # Cap for the exponential reconnect backoff
+    # Tool results larger than this many bytes of JSON are kept on the server and returned as a
+    # unity://results resource to read in pages (0 disables)
+    result_inline_limit: int = 64 * 1024
+    result_page_size: int = 100  # Items per page of a stored result's main list
+    # Bytes of JSON kept across stored results; the least recently read are evicted first
+    result_store_budget: int = 64 * 1024 * 1024
+    job_retention: float = 600.0  # Keep finished background jobs for this many seconds
+    job_progress_interval: float = 1.0  # Report progress to callers awaiting a job this often
+    loop_lag_interval: float = 0.1  # Sample event loop lag this often for the stats resource (0 disables)
 
 # Create a global config instance
 config = ServerConfig() 
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Background jobs for long-running Unity operations.
+
+A tool called with `as_job` submits its command as a job and returns the job's
+ID right away instead of holding the tool call open; the manage_job tool then
+polls, awaits or cancels it. Jobs send their command through the client's
+session like any other call, so they are scheduled as bulk work and leave
+interactive commands flowing. A job's result is finished the way its tool
+finishes inline results, and only the client session that submitted a job
+can see or cancel it.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict
+from config import config
+from unity_connection import get_unity_session
+
+logger = logging.getLogger("UnityMCP")
+
+@dataclass
+class UnityJob:
+    """One command running in the background, with its progress and outcome."""
+    id: str
+    command_type: str
+    action: str | None = None
+    editor: str | None = None
+    session: str | None = None  # ID of the client session that submitted it
+    task: asyncio.Task = None
+    state: str = "running"  # "running", "succeeded", "failed" or "cancelled"
+    progress: float = 0.0
+    total: float | None = None
+    result: Any = None
+    images: list = field(default_factory=list)  # Image content the tool returns after the result
+    error: str | None = None
+    submitted: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    async def report(self, progress: float, total: float | None = None):
+        """Record progress; passed to send_command as its progress callback."""
+        self.progress, self.total = progress, total
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.submitted
+
+    def status(self, include_result: bool = True) -> Dict[str, Any]:
+        status = {
+            "job_id": self.id,
+            "command": self.command_type,
+            "action": self.action,
+            "editor": self.editor,
+            "session": self.session,
+            "state": self.state,
+            "progress": self.progress,
+            "total": self.total,
+            "elapsed": round(self.elapsed, 3),
+        }
+        if self.error is not None:
+            status["error"] = self.error
+        if include_result and self.state == "succeeded":
+            status["result"] = self.result
+        return status
+
+class JobManager:
+    """Runs submitted commands as background jobs and keeps finished ones for `retention` seconds."""
+
+    def __init__(self, retention: float = config.job_retention):
+        self.retention = retention
+        self.jobs: Dict[str, UnityJob] = {}
+
+    def submit(self, sender, command_type: str, params: Dict[str, Any] = None, editor: str = None,
+               timeout: float = None, finish=None) -> UnityJob:
+        """Start sending a command through `sender`, a session or router, and return its job.
+
+        `finish(result)` turns Unity's result into what the tool would have
+        returned inline: a result, or a list of it and image content.
+        """
+        self.prune()
+        job = UnityJob(uuid.uuid4().hex[:12], command_type, (params or {}).get("action"), editor,
+                       getattr(sender, "id", None))
+        job.task = asyncio.create_task(self._run(job, sender, params, timeout, finish))
+        self.jobs[job.id] = job
+        logger.info(f"Started job {job.id}: {command_type} {job.action or ''}".rstrip())
+        return job
+
+    async def _run(self, job: UnityJob, sender, params: Dict[str, Any], timeout: float, finish=None):
+        try:
+            result = await sender.send_command(job.command_type, params, job.editor, timeout, progress=job.report)
+            if finish is not None:
+                result = finish(result)
+            if isinstance(result, list):
+                result, job.images = result[0], result[1:]
+            job.result = result
+            job.state = "succeeded"
+        except asyncio.CancelledError:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state, job.error = "failed", str(e)
+        finally:
+            job.finished = time.monotonic()
+            logger.info(f"Job {job.id} {job.state} after {job.elapsed:.1f}s")
+
+    def get(self, job_id: str, session: str | None = None) -> UnityJob:
+        """Return a job by ID, if the session `session` submitted it."""
+        job = self.jobs.get(job_id)
+        if job is None or job.session != session:
+            raise ValueError(f"No job '{job_id}'. Finished jobs are kept for {self.retention:.0f} seconds.")
+        return job
+
+    def jobs_of(self, session: str | None = None) -> list:
+        """Return the jobs the session `session` submitted."""
+        self.prune()
+        return [job for job in self.jobs.values() if job.session == session]
+
+    async def wait(self, job_id: str, session: str | None = None, timeout: float = None, progress=None) -> UnityJob:
+        """Wait up to `timeout` seconds for a job to finish and return it.
+
+        While waiting, `progress(progress, total)` is awaited every
+        `job_progress_interval` seconds with the job's upload progress, or
+        with the seconds elapsed when there is none, so the caller's client
+        sees the job is alive.
+        """
+        job = self.get(job_id, session)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not job.task.done():
+            interval = config.job_progress_interval
+            if deadline is not None:
+                interval = min(interval, deadline - time.monotonic())
+                if interval <= 0:
+                    break
+            await asyncio.wait((job.task,), timeout=interval)
+            if progress is not None and not job.task.done():
+                if job.total:
+                    await progress(job.progress, job.total)
+                else:
+                    await progress(job.elapsed)
+        return job
+
+    async def cancel(self, job_id: str, session: str | None = None) -> UnityJob:
+        """Stop waiting on a job. Unity finishes a command it has already started regardless."""
+        job = self.get(job_id, session)
+        if not job.task.done():
+            job.task.cancel()
+            await asyncio.wait((job.task,))
+        return job
+
+    def prune(self):
+        """Forget jobs that finished more than `retention` seconds ago."""
+        expired = time.monotonic() - self.retention
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished and job.finished < expired]:
+            del self.jobs[job_id]
+
+# Global job manager, bound to the event loop that created it
+_job_manager = None
+_job_manager_loop = None
+
+def get_job_manager() -> JobManager:
+    """Retrieve the job manager for the running event loop, creating it if needed."""
+    global _job_manager, _job_manager_loop
+    loop = asyncio.get_running_loop()
+    if _job_manager is None or _job_manager_loop is not loop:
+        _job_manager, _job_manager_loop = JobManager(), loop
+    return _job_manager
+
+def submit_job(ctx, command_type: str, params: Dict[str, Any], editor: str = None, finish=None) -> Dict[str, Any]:
+    """Start a tool's command as a job for the calling client and return the tool result naming it."""
+    job = get_job_manager().submit(get_unity_session(ctx), command_type, params, editor, finish=finish)
+    return {
+        "success": True,
+        "message": f"Started job {job.id}. Use manage_job to await, poll or cancel it.",
+        "data": job.status(),
+    }
@@ -0,0 +1,196 @@
+"""
+Server-side storage for tool results too large to return inline.
+
+A result over `result_inline_limit` bytes of JSON is kept here and the tool
+returns a small stand-in naming its unity://results resource, with its size
+and a summary of its shape. Clients then read pages of its main list, or
+subtrees by path, only as they need them. Stored results are evicted least
+recently used first once they exceed `result_store_budget`.
+
+The store is shared by every client of the server, so results are never
+listed; a result's ID, returned only to the client that ran the command, is
+what grants access to it.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict
+from config import config
+
+logger = logging.getLogger("UnityMCP")
+
+RESULT_URI = "unity://results/{result_id}"
+
+def json_size(value: Any) -> int:
+    """Return the size of a value serialized as JSON, in bytes."""
+    return len(json.dumps(value, default=str).encode("utf-8"))
+
+def summarize(value: Any) -> Dict[str, Any]:
+    """Describe a value's shape without its contents: keys of objects, lengths of arrays."""
+    if isinstance(value, dict):
+        return {"type": "object", "keys": list(value)[:50], "size": len(value)}
+    if isinstance(value, list):
+        return {"type": "array", "length": len(value)}
+    return {"type": type(value).__name__}
+
+def main_list(value: Any, path: tuple = (), depth: int = 3) -> tuple | None:
+    """Return (path, list) for the longest list within `depth` levels of `value`, the one paged through."""
+    best = (path, value) if isinstance(value, list) else None
+    if depth > 0 and isinstance(value, dict):
+        for key, item in value.items():
+            found = main_list(item, path + (key,), depth - 1)
+            if found and (best is None or len(found[1]) > len(best[1])):
+                best = found
+    return best
+
+def resolve_path(value: Any, path: str) -> Any:
+    """Return the part of `value` a dotted path names, e.g. "data.0.children"."""
+    for key in path.split(".") if path else ():
+        if isinstance(value, list):
+            try:
+                value = value[int(key)]
+            except (ValueError, IndexError):
+                raise ValueError(f"No item '{key}' in an array of {len(value)}")
+        elif isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            raise ValueError(f"No key '{key}' at this point in the result")
+    return value
+
+@dataclass
+class StoredResult:
+    """One stored result and what a client needs to know to fetch it."""
+    id: str
+    command: str
+    value: Any
+    size: int  # Bytes of JSON
+    list_path: str | None = None  # Dotted path of the main list, if there is one
+    created: float = field(default_factory=time.time)
+    reads: int = 0
+
+    @property
+    def uri(self) -> str:
+        return RESULT_URI.format(result_id=self.id)
+
+    @property
+    def pages(self) -> int:
+        if self.list_path is None:
+            return 0
+        length = len(resolve_path(self.value, self.list_path))
+        return max(1, -(-length // config.result_page_size))
+
+    def describe(self) -> Dict[str, Any]:
+        """Size, shape and the URIs to read the result by."""
+        description = {
+            "resource": self.uri,
+            "command": self.command,
+            "size": self.size,
+            "summary": summarize(self.value),
+            "path_uri": f"{self.uri}/path/{{path}}",
+        }
+        if isinstance(self.value, dict) and "data" in self.value:
+            description["data_summary"] = summarize(self.value["data"])
+        if self.list_path is not None:
+            description.update({
+                "list_path": self.list_path,
+                "pages": self.pages,
+                "page_size": config.result_page_size,
+                "page_uri": f"{self.uri}/page/{{page}}",
+            })
+        return description
+
+class ResultStore:
+    """Least recently used store of large results, bounded to `budget` bytes of JSON."""
+
+    def __init__(self, budget: int = config.result_store_budget):
+        self.budget = budget
+        self.used = 0
+        self._results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self._counters = dict.fromkeys(("stored", "evicted", "reads", "misses"), 0)
+
+    def put(self, command: str, value: Any, size: int) -> StoredResult | None:
+        """Store a result, evicting older ones as needed; None if it can't fit at all."""
+        if size > self.budget:
+            return None
+        found = main_list(value)
+        stored = StoredResult(uuid.uuid4().hex, command, value, size, ".".join(found[0]) if found else None)
+        while self._results and self.used + size > self.budget:
+            _, evicted = self._results.popitem(last=False)
+            self.used -= evicted.size
+            self._counters["evicted"] += 1
+        self._results[stored.id] = stored
+        self.used += size
+        self._counters["stored"] += 1
+        return stored
+
+    def get(self, result_id: str) -> StoredResult:
+        """Return a stored result, marking it recently used."""
+        stored = self._results.get(result_id)
+        if stored is None:
+            self._counters["misses"] += 1
+            raise ValueError(f"No stored result '{result_id}'; it may have been evicted. Run the command again.")
+        self._results.move_to_end(result_id)
+        stored.reads += 1
+        self._counters["reads"] += 1
+        return stored
+
+    def page(self, result_id: str, page: int) -> Dict[str, Any]:
+        """Return one page, counted from 1, of a stored result's main list."""
+        stored = self.get(result_id)
+        if stored.list_path is None:
+            raise ValueError(f"Result '{result_id}' has no list to page through; read it by path instead")
+        items = resolve_path(stored.value, stored.list_path)
+        size = config.result_page_size
+        if not 1 <= page <= stored.pages:
+            raise ValueError(f"Page {page} is out of range; result '{result_id}' has {stored.pages} page(s)")
+        return {
+            "list_path": stored.list_path,
+            "page": page,
+            "pages": stored.pages,
+            "total": len(items),
+            "items": items[(page - 1) * size:page * size],
+        }
+
+    def subtree(self, result_id: str, path: str) -> Dict[str, Any]:
+        """Return the part of a stored result at a dotted path, or its summary if that is too large too."""
+        value = resolve_path(self.get(result_id).value, path)
+        size = json_size(value)
+        if size > config.result_inline_limit:
+            return {"path": path, "size": size, "summary": summarize(value),
+                    "message": "Too large to return inline; read a narrower path."}
+        return {"path": path, "size": size, "value": value}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "results": len(self._results),
+            "used": self.used,
+            "budget": self.budget,
+            **self._counters,
+        }
+
+# Global result store, shared by every client of this server
+result_store = ResultStore()
+
+def offload_large_result(command: str, result: Any) -> Any:
+    """Return `result`, or a stand-in naming the resource it was stored as if it is too large to send inline."""
+    limit = config.result_inline_limit
+    if limit <= 0:
+        return result
+    size = json_size(result)
+    if size <= limit:
+        return result
+    stored = result_store.put(command, result, size)
+    if stored is None:
+        logger.warning(f"{command} result of {size} bytes exceeds the result store budget; returning it inline")
+        return result
+    logger.info(f"Stored {size} byte {command} result as {stored.uri}")
+    return {
+        "success": result.get("success", True) if isinstance(result, dict) else True,
+        "message": f"The result is {size} bytes, too large to return inline. "
+                   f"Read it in pages from page_uri, or by dotted path from path_uri.",
+        "data": stored.describe(),
+    }
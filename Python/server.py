@@ -1,11 +1,13 @@
 from mcp.server.fastmcp import FastMCP, Context, Image
+import asyncio
 import logging
 from dataclasses import dataclass
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import AsyncIterator, Dict, Any, List
 from config import config
 from tools import register_all_tools
-from unity_connection import get_unity_connection, UnityConnection
+from results import result_store
+from unity_connection import UnitySession, get_unity_pool, get_unity_router, stop_heartbeats
 
 # Configure logging using settings from config
 logging.basicConfig(
@@ -14,30 +16,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger("UnityMCP")
 
-# Global connection state
-_unity_connection: UnityConnection = None
+@dataclass
+class LoopLag:
+    """How late the server's event loop wakes up; blocking work on it shows up as lag."""
+    samples: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "average": self.total / self.samples if self.samples else 0.0,
+            "max": self.max,
+        }
+
+loop_lag = LoopLag()
+
+async def monitor_loop_lag(interval: float):
+    """Sleep `interval` seconds at a time, recording how much longer each sleep took."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - started - interval)
+        loop_lag.samples += 1
+        loop_lag.total += lag
+        loop_lag.max = max(loop_lag.max, lag)
 
 @asynccontextmanager
-async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
-    """Handle server startup and shutdown."""
-    global _unity_connection
+async def unity_layer() -> AsyncIterator[Any]:
+    """Run the Unity connection layer that every client session shares."""
     logger.info("UnityMCP server starting up")
+    # Connect in the background so the server answers MCP requests right away
+    # even if Unity is slow or unreachable; tool calls wait for it briefly
+    pool = get_unity_pool()
+    pool.warm_up()
+    monitor = asyncio.create_task(monitor_loop_lag(config.loop_lag_interval)) if config.loop_lag_interval > 0 else None
     try:
-        _unity_connection = get_unity_connection()
-        logger.info("Connected to Unity on startup")
-    except Exception as e:
-        logger.warning(f"Could not connect to Unity on startup: {str(e)}")
-        _unity_connection = None
-    try:
-        # Yield the connection object so it can be attached to the context
-        # The key 'bridge' matches how tools like read_console expect to access it (ctx.bridge)
-        yield {"bridge": _unity_connection}
+        yield pool
     finally:
-        if _unity_connection:
-            _unity_connection.disconnect()
-            _unity_connection = None
+        if monitor is not None:
+            monitor.cancel()
+        await pool.close()
+        await stop_heartbeats()
         logger.info("UnityMCP server shut down")
 
+# Connection pool of the layer the HTTP transport runs for all sessions
+shared_pool = None
+# Client sessions currently open, by ID
+sessions: Dict[str, UnitySession] = {}
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Open a client session, starting the Unity connection layer for it under stdio."""
+    async with AsyncExitStack() as stack:
+        pool = shared_pool or await stack.enter_async_context(unity_layer())
+        session = UnitySession(get_unity_router())
+        sessions[session.id] = session
+        logger.info(f"MCP client {session.id} connected")
+        try:
+            # Yield the connection pool so it can be attached to the context
+            # The key 'bridge' matches how tools like read_console expect to access it (ctx.bridge)
+            yield {"bridge": pool, "session": session}
+        finally:
+            del sessions[session.id]
+            logger.info(f"MCP client {session.id} disconnected after {session.commands} command(s)")
+
 # Initialize MCP server
 mcp = FastMCP(
     "UnityMCP",
@@ -48,6 +92,42 @@ mcp = FastMCP(
 # Register all tools
 register_all_tools(mcp)
 
+@mcp.resource("unity://connection/stats", name="connection_stats", mime_type="application/json")
+def connection_stats() -> Dict[str, Any]:
+    """Connection pool occupancy and counters, event loop lag and client sessions, for tuning pool settings."""
+    return {
+        **get_unity_pool().stats(),
+        "event_loop_lag": loop_lag.stats(),
+        "sessions": {session_id: session.status() for session_id, session in sessions.items()},
+    }
+
+@mcp.resource("unity://editors", name="unity_editors", mime_type="application/json")
+async def unity_editors() -> Dict[str, Any]:
+    """Unity Editors running on this machine, with per-editor health and load, by name."""
+    router = get_unity_router()
+    await router.discover()
+    return router.stats()
+
+@mcp.resource("unity://results", name="stored_results", mime_type="application/json")
+def stored_results() -> Dict[str, Any]:
+    """Usage and counters of the store of large tool results, shared by every client."""
+    return result_store.stats()
+
+@mcp.resource("unity://results/{result_id}", name="stored_result", mime_type="application/json")
+def stored_result(result_id: str) -> Dict[str, Any]:
+    """Size, shape and page count of a stored result."""
+    return result_store.get(result_id).describe()
+
+@mcp.resource("unity://results/{result_id}/page/{page}", name="stored_result_page", mime_type="application/json")
+def stored_result_page(result_id: str, page: int) -> Dict[str, Any]:
+    """One page, counted from 1, of a stored result's main list."""
+    return result_store.page(result_id, page)
+
+@mcp.resource("unity://results/{result_id}/path/{path}", name="stored_result_path", mime_type="application/json")
+def stored_result_path(result_id: str, path: str) -> Dict[str, Any]:
+    """Part of a stored result by dotted path, e.g. data.0.children for a hierarchy subtree."""
+    return result_store.subtree(result_id, path)
+
 # Asset Creation Strategy
 
 @mcp.prompt()
@@ -61,12 +141,78 @@ def asset_creation_strategy() -> str:
         "- `manage_scene`: Manages scenes.\\n"
         "- `manage_gameobject`: Manages GameObjects in the scene.\\n"
         "- `manage_script`: Manages C# script files.\\n"
-        "- `manage_asset`: Manages prefabs and assets.\\n\\n"
+        "- `manage_asset`: Manages prefabs and assets.\\n"
+        "- `manage_job`: Polls, awaits or cancels jobs started with `as_job=True`.\\n\\n"
         "Tips:\\n"
         "- Create prefabs for reusable GameObjects.\\n"
+        "- With several Unity Editors open, pass `editor` (port, project name or path) to pick one; "
+        "the `unity://editors` resource lists them.\\n"
+        "- Pass `as_job=True` for long scene loads, imports, script writes and menu items, "
+        "then await the job with `manage_job`, so other commands keep flowing meanwhile.\\n"
+        "- Results too large to return inline come back as a `unity://results` resource; "
+        "read its pages or a subtree by path instead of re-running the command.\\n"
         "- Always include a camera and main light in your scenes.\\n"
     )
 
+async def run_sse():
+    """Serve MCP over HTTP with server-sent events, one session per client.
+
+    The Unity connection layer starts with the HTTP server rather than with
+    each session, so clients share its pooled connections, heartbeats and
+    in-flight reads, and one client leaving doesn't close them for the rest.
+    """
+    import uvicorn
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    sse = SseServerTransport("/messages/")
+    server = mcp._mcp_server
+
+    async def handle_sse(request: Request) -> Response:
+        disconnected = asyncio.Event()
+
+        async def receive():
+            message = await request.receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            return message
+
+        async with sse.connect_sse(request.scope, receive, request._send) as (read_stream, write_stream):
+            # The transport doesn't end a session when its client goes away, so end it here
+            serving = asyncio.create_task(server.run(read_stream, write_stream, server.create_initialization_options()))
+            watching = asyncio.create_task(disconnected.wait())
+            try:
+                await asyncio.wait((serving, watching), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                serving.cancel()
+                watching.cancel()
+                await asyncio.gather(serving, watching, return_exceptions=True)
+        # The event stream has already been sent; this only satisfies Starlette
+        return Response()
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        global shared_pool
+        async with unity_layer() as shared_pool:
+            try:
+                yield
+            finally:
+                shared_pool = None
+
+    app = Starlette(
+        routes=[Route("/sse", endpoint=handle_sse), Mount("/messages/", app=sse.handle_post_message)],
+        lifespan=lifespan,
+    )
+    logger.info(f"Serving MCP clients at http://{config.mcp_host}:{config.mcp_port}/sse")
+    await uvicorn.Server(uvicorn.Config(
+        app, host=config.mcp_host, port=config.mcp_port, log_level=config.log_level.lower())).serve()
+
 # Run the server
 if __name__ == "__main__":
-    mcp.run(transport='stdio')
\ No newline at end of file
+    if config.mcp_transport == "sse":
+        asyncio.run(run_sse())
+    else:
+        mcp.run(transport='stdio')
\ No newline at end of file
@@ -4,7 +4,8 @@ Defines the execute_menu_item tool for running Unity Editor menu commands.
 
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection  # Import unity_connection module
+from unity_connection import get_unity_session  # Import unity_connection module
+from jobs import submit_job
 
 
 def register_execute_menu_item_tools(mcp: FastMCP):
@@ -16,6 +17,8 @@ def register_execute_menu_item_tools(mcp: FastMCP):
         menu_path: str,
         action: str = "execute",
         parameters: Dict[str, Any] | None = None,
+        editor: str | None = None,
+        as_job: bool = False,
     ) -> Dict[str, Any]:
         """Executes a Unity Editor menu item via its path (e.g., "File/Save Project").
 
@@ -24,6 +27,8 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             menu_path: The full path of the menu item to execute.
             action: The operation to perform (default: 'execute').
             parameters: Optional parameters for the menu item (rarely used).
+            editor: Unity Editor to target, by port, project name or project path; 'all' runs 'get_available_menus' on every editor. Defaults to the editor on the configured port.
+            as_job: Run in the background, e.g. for menu items that start builds or bakes, and return a job ID right away; follow it with manage_job.
 
         Returns:
             A dictionary indicating success or failure, with optional message/error.
@@ -44,10 +49,9 @@ def register_execute_menu_item_tools(mcp: FastMCP):
         if "parameters" not in params_dict:
             params_dict["parameters"] = {}  # Ensure parameters dict exists
 
-        # Get Unity connection and send the command
-        # We use the unity_connection module to communicate with Unity
-        unity_conn = get_unity_connection()
+        if as_job:
+            return submit_job(ctx, "execute_menu_item", params_dict, editor)
 
-        # Send command to the ExecuteMenuItem C# handler
+        # Send command to the ExecuteMenuItem C# handler of the selected editor
         # The command type should match what the Unity side expects
-        return unity_conn.send_command("execute_menu_item", params_dict)
+        return await get_unity_session(ctx).send_command("execute_menu_item", params_dict, editor)
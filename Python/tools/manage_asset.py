@@ -2,14 +2,73 @@
 Defines the manage_asset tool for interacting with Unity assets.
 """
 
-import asyncio  # Added: Import asyncio for running sync code in async
-from typing import Dict, Any
-from mcp.server.fastmcp import FastMCP, Context
+import base64
+from typing import Dict, Any, List
+from mcp.server.fastmcp import FastMCP, Context, Image
 
 # from ..unity_connection import get_unity_connection  # Original line that caused error
 from unity_connection import (
-    get_unity_connection,
+    ALL_EDITORS,
+    get_unity_session,
 )  # Use absolute import relative to Python dir
+from jobs import submit_job
+from results import offload_large_result
+
+
+def extract_previews(value: Any, previews: List[Image]) -> Any:
+    """Return a result with its asset preview PNGs moved into `previews`, as MCP image content.
+
+    Previews arrive as raw bytes when the bridge sent them as binary attachments,
+    and as base64 text otherwise. The result is rebuilt rather than edited, as
+    concurrent identical reads share the one Unity returned.
+    """
+    if isinstance(value, dict):
+        preview = value.get("previewBase64")
+        if preview:
+            png = base64.b64decode(preview) if isinstance(preview, str) else preview
+            previews.append(Image(data=png, format="png"))
+            index = len(previews) - 1
+        value = {key: extract_previews(item, previews) for key, item in value.items() if key != "previewBase64"}
+        if preview:
+            value["previewIndex"] = index
+    elif isinstance(value, list):
+        value = [extract_previews(item, previews) for item in value]
+    return value
+
+
+def finish_result(result: Any, previews: List[Image]) -> Any:
+    """Return a result followed by its previews, storing it to read in pages if it is large."""
+    result = offload_large_result("manage_asset", result)
+    return [result, *previews] if previews else result
+
+
+def process_response(result: Any) -> Any:
+    """Turn Unity's result into the tool's: previews as image content, large results stored."""
+    previews: List[Image] = []
+    return finish_result(extract_previews(result, previews), previews)
+
+
+def merge_searches(patterns: List[str], results: list) -> Dict[str, Any]:
+    """Combine the results of one search per pattern, listing each asset found once."""
+    assets, seen, searches = [], set(), []
+    for pattern, result in zip(patterns, results):
+        if isinstance(result, Exception) or not result.get("success", True):
+            error = str(result) if isinstance(result, Exception) else result.get("error") or result.get("message")
+            searches.append({"searchPattern": pattern, "success": False, "error": error})
+            continue
+        data = result.get("data") or {}
+        searches.append({"searchPattern": pattern, "success": True, "totalAssets": data.get("totalAssets")})
+        for asset in data.get("assets") or ():
+            guid = asset.get("guid") if isinstance(asset, dict) else None
+            if guid is None or guid not in seen:
+                seen.add(guid)
+                assets.append(asset)
+    succeeded = sum(1 for search in searches if search["success"])
+    return {
+        "success": succeeded > 0,
+        "message": f"Found {len(assets)} asset(s) with {succeeded} of {len(patterns)} search patterns.",
+        "data": {"totalAssets": len(assets), "assets": assets, "searches": searches},
+    }
 
 
 def register_manage_asset_tools(mcp: FastMCP):
@@ -25,11 +84,14 @@ def register_manage_asset_tools(mcp: FastMCP):
         destination: str | None = None,
         generate_preview: bool | None = False,
         search_pattern: str | None = None,
+        search_patterns: List[str] | None = None,
         filter_type: str | None = None,
         filter_date_after: str | None = None,
         page_size: int | None = None,
         page_number: int | None = None,
-    ) -> Dict[str, Any]:
+        editor: str | None = None,
+        as_job: bool = False,
+    ) -> Dict[str, Any] | list:
         """Performs asset operations (import, create, modify, delete, etc.) in Unity.
 
         Args:
@@ -39,15 +101,18 @@ def register_manage_asset_tools(mcp: FastMCP):
             asset_type (str | None): The type of asset to create (e.g., "Material", "ScriptableObject", "Folder").  Required only for the 'create' action.
             properties (Dict[str, Any] | None): A dictionary of properties to apply to the asset during 'create' or 'modify'. The specific keys and values depend on the asset type. For materials, properties like "shader," "color," "texture," etc. can be set. For ScriptableObjects, properties map to public fields/properties.
             destination (str | None): The destination path for 'duplicate' or 'move/rename' actions. If omitted for 'duplicate', a unique path will be generated.
-            generate_preview (bool | None):  If True, generates a preview image (base64 encoded PNG) for the asset when getting asset info ('get_info' and 'search').
+            generate_preview (bool | None):  If True, generates a preview image (PNG) for the asset when getting asset info ('get_info' and 'search'). Previews are returned as image content following the result, referenced by each asset's "previewIndex".
             search_pattern (str | None): The search pattern for the 'search' action (e.g., "*.prefab" to find all prefabs).
+            search_patterns (List[str] | None): Several search patterns for one 'search', run as independent searches spread over the editors `editor` selects (e.g., one project open in more than one editor), with the assets found merged and each listed once.
             filter_type (str | None): Filters search results by asset type (e.g., "t:Material" to find only materials). Used with the 'search' action.
             filter_date_after (str | None): Filters search results to include only assets modified after the specified date and time (ISO 8601 format, e.g., "2024-10-26T12:00:00Z"). Used with the 'search' action.
             page_size (int | None): The number of results per page for the 'search' action. If omitted, a default page size is used (usually 50).
             page_number (int | None):  The page number to retrieve for the 'search' action (1-based indexing). If omitted, the first page is returned.
+            editor (str | None): The Unity Editor to target, by port, project name or project path. 'all' runs 'search', 'get_info' and 'get_components' on every editor and returns each editor's result by name. Defaults to the editor on the configured port.
+            as_job (bool): Run in the background, e.g. for large imports, and return a job ID right away; follow it with manage_job. The job's result is what the tool would have returned, previews included. Not available with search_patterns.
 
         Returns:
-            Dict[str, Any]: A dictionary containing the results from Unity.  The dictionary will typically have a "success" key (boolean) indicating whether the operation was successful.  If successful, there might be a "data" key with the results (e.g., the created asset's data, the list of found assets).  If unsuccessful, there will be an "error" key with the error message.
+            Dict[str, Any] | list: A dictionary containing the results from Unity, followed by any preview images.  The dictionary will typically have a "success" key (boolean) indicating whether the operation was successful.  If successful, there might be a "data" key with the results (e.g., the created asset's data, the list of found assets).  If unsuccessful, there will be an "error" key with the error message.  Results too large to return inline are stored, and "data" names the unity://results resource to read them from in pages.
         """
         # Ensure properties is a dict if None
         if properties is None:
@@ -71,18 +136,33 @@ def register_manage_asset_tools(mcp: FastMCP):
         # Remove None values to avoid sending unnecessary nulls
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        # Get the current asyncio event loop
-        loop = asyncio.get_running_loop()
-        # Get the Unity connection instance
-        connection = get_unity_connection()
-
-        # Run the synchronous send_command in the default executor (thread pool)
-        # This prevents blocking the main async event loop.
-        result = await loop.run_in_executor(
-            None,  # Use default executor
-            connection.send_command,  # The function to call
-            "manage_asset",  # First argument for send_command
-            params_dict,  # Second argument for send_command
+        if as_job:
+            if search_patterns:
+                return {"success": False, "message": "A search with search_patterns cannot run as a job; search one pattern per job instead."}
+            return submit_job(ctx, "manage_asset", params_dict, editor, finish=process_response)
+
+        # Send on a pooled connection so independent calls can overlap,
+        # awaiting the response so other MCP traffic keeps flowing
+        previews: List[Image] = []
+        session = get_unity_session(ctx)
+        if params_dict["action"] == "search" and search_patterns:
+            # Independent searches go to whichever matching editor is least busy
+            patterns = list(dict.fromkeys([*([search_pattern] if search_pattern else []), *search_patterns]))
+            results = await session.distribute(
+                [("manage_asset", {**params_dict, "searchPattern": pattern}) for pattern in patterns], editor
+            )
+            return process_response(merge_searches(patterns, results))
+        elif params_dict["action"] == "search" and (editor or "").strip().lower() not in ALL_EDITORS:
+            # Large searches stream their matches, decoded page by page as they arrive
+            async with session.stream_command("manage_asset", params_dict, editor) as matches:
+                assets = []
+                async for batch in matches.batches():
+                    assets.extend(extract_previews(batch, previews))
+                # Large results, such as big searches, are stored to read in pages
+                return finish_result(matches.assemble(assets), previews)
+        # Large property payloads upload in chunks and report progress
+        result = await session.send_command(
+            "manage_asset", params_dict, editor, progress=ctx.report_progress
         )
-        # Return the result obtained from Unity
-        return result
+        # Return previews as image content rather than base64 text inside the result
+        return process_response(result)
@@ -1,13 +1,13 @@
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any
-from unity_connection import get_unity_connection
+from unity_connection import get_unity_session
 
 
 def register_manage_editor_tools(mcp: FastMCP):
     """Register all editor management tools with the MCP server."""
 
     @mcp.tool()
-    def manage_editor(
+    async def manage_editor(
         ctx: Context,
         action: str,
         wait_for_completion: bool | None = None,
@@ -15,6 +15,7 @@ def register_manage_editor_tools(mcp: FastMCP):
         tool_name: str | None = None,
         tag_name: str | None = None,
         layer_name: str | None = None,
+        editor: str | None = None,
     ) -> Dict[str, Any]:
         """Controls and queries the Unity editor's state and settings, including play mode, active tool, selection, tags, and layers.
 
@@ -30,6 +31,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             tool_name (str | None): The name of the tool to set as active (e.g., "Move," "Rotate," "Scale").  Used with the 'set_active_tool' action.  Case-insensitive.  You cannot directly activate custom tools with this.
             tag_name (str | None): The name of the tag to add or remove. Used with 'add_tag' and 'remove_tag' actions.
             layer_name (str | None): The name of the layer to add or remove. Used with 'add_layer' and 'remove_layer' actions.
+            editor (str | None): The Unity Editor to target, by port, project name or project path. 'all' runs read-only actions on every editor and returns each editor's result by name. Defaults to the editor on the configured port.
 
 
         Returns:
@@ -57,7 +59,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             params = {k: v for k, v in params.items() if v is not None}
 
             # Send command to Unity
-            response = get_unity_connection().send_command("manage_editor", params)
+            response = await get_unity_session(ctx).send_command("manage_editor", params, editor)
 
             # Process response
             if response.get("success"):
@@ -1,13 +1,13 @@
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any, List
-from unity_connection import get_unity_connection
+from unity_connection import get_unity_session
 
 
 def register_manage_gameobject_tools(mcp: FastMCP):
     """Register all GameObject management tools with the MCP server."""
 
     @mcp.tool()
-    def manage_gameobject(
+    async def manage_gameobject(
         ctx: Context,
         action: str,
         target: str | None = None,  # GameObject identifier by name or path
@@ -39,6 +39,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
         search_inactive: bool = False,
         # -- Component Management Arguments --
         component_name: str | None = None,
+        editor: str | None = None,
     ) -> Dict[str, Any]:
         """Manages GameObjects in the Unity scene: create, modify, delete, find, and component operations.
 
@@ -79,6 +80,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             search_in_children (bool): If True, the search will be limited to the children of the 'target' GameObject (when 'action' is 'find').
             search_inactive (bool): If True, include inactive GameObjects in searches (for 'find' and when resolving the 'target' object).
             component_name (str | None): The name of the component to add, remove, or set properties on. Used with 'add_component', 'remove_component', and 'set_component_property' actions.
+            editor (str | None): The Unity Editor to target, by port, project name or project path. 'all' runs 'find' and 'get_components' on every editor and returns each editor's result by name. Defaults to the editor on the configured port.
 
         Returns:
             Dict[str, Any]: A dictionary containing the results of the operation:
@@ -145,10 +147,9 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             params.pop("prefab_folder", None)
             # --------------------------------
 
-            # Send the command to Unity via the established connection
-            # Use the get_unity_connection function to retrieve the active connection instance
+            # Send the command to the selected Unity Editor
             # Changed "MANAGE_GAMEOBJECT" to "manage_gameobject" to potentially match Unity expectation
-            response = get_unity_connection().send_command("manage_gameobject", params)
+            response = await get_unity_session(ctx).send_command("manage_gameobject", params, editor)
 
             # Check if the response indicates success
             # If the response is not successful, raise an exception with the error message
@@ -0,0 +1,72 @@
+"""
+Defines the manage_job tool for following background jobs started by other tools.
+"""
+
+from typing import Dict, Any
+from mcp.server.fastmcp import FastMCP, Context
+from jobs import get_job_manager
+from unity_connection import get_unity_session
+from results import offload_large_result
+
+
+def register_manage_job_tools(mcp: FastMCP):
+    """Registers the manage_job tool with the MCP server."""
+
+    @mcp.tool()
+    async def manage_job(
+        ctx: Context,
+        action: str,
+        job_id: str | None = None,
+        timeout: float | None = None,
+    ) -> Dict[str, Any] | list:
+        """Polls, awaits or cancels background jobs this client started by calling tools with as_job=True.
+
+        Args:
+            ctx: The MCP context.
+            action: Operation ('get', 'await', 'cancel', 'list').
+            job_id: ID returned when the job was submitted. Required except for 'list'.
+            timeout: For 'await', seconds to wait before returning a job that is still running (default: until it finishes).
+
+        Returns:
+            Dictionary with results. 'data' holds the job's state, progress and, once it succeeded, the tool's result, followed by any images the tool returns.
+        """
+        try:
+            jobs = get_job_manager()
+            # Jobs belong to the client session that submitted them
+            session = getattr(get_unity_session(ctx), "id", None)
+            action = action.lower()
+            if action == "list":
+                own = jobs.jobs_of(session)
+                return {
+                    "success": True,
+                    "message": f"{len(own)} job(s).",
+                    "data": [job.status(include_result=False) for job in own],
+                }
+            if not job_id:
+                return {"success": False, "message": f"'{action}' needs a job_id."}
+
+            if action == "get":
+                job = jobs.get(job_id, session)
+            elif action == "await":
+                # Progress keeps the client informed, and its request alive, while the job runs
+                job = await jobs.wait(job_id, session, timeout, progress=ctx.report_progress)
+            elif action == "cancel":
+                job = await jobs.cancel(job_id, session)
+            else:
+                return {"success": False, "message": f"Unknown action '{action}'. Use 'get', 'await', 'cancel' or 'list'."}
+
+            result = offload_large_result("manage_job", {
+                "success": job.state != "failed",
+                "message": f"Job {job.id} {job.state}." + (f" {job.error}" if job.error else ""),
+                "data": job.status(),
+            })
+            # Images, such as asset previews, follow the result as they do when the tool runs inline
+            if job.state == "succeeded" and job.images:
+                return [result, *job.images]
+            return result
+
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Python error managing job: {str(e)}",
+            }
@@ -1,18 +1,39 @@
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any
-from unity_connection import get_unity_connection
+from unity_connection import get_unity_session
+from jobs import submit_job
+from results import offload_large_result
+
+
+def process_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn Unity's response into the tool's result; large hierarchies are stored to read in pages."""
+    if response.get("success"):
+        return offload_large_result("manage_scene", {
+            "success": True,
+            "message": response.get("message", "Scene operation successful."),
+            "data": response.get("data"),
+        })
+    else:
+        return {
+            "success": False,
+            "message": response.get(
+                "error", "An unknown error occurred during scene management."
+            ),
+        }
 
 
 def register_manage_scene_tools(mcp: FastMCP):
     """Register all scene management tools with the MCP server."""
 
     @mcp.tool()
-    def manage_scene(
+    async def manage_scene(
         ctx: Context,
         action: str,
         name: str | None = None,
         path: str | None = None,
         build_index: int | None = None,
+        editor: str | None = None,
+        as_job: bool = False,
     ) -> Dict[str, Any]:
         """Manages Unity scenes (load, save, create, get hierarchy, etc.).
 
@@ -21,10 +42,12 @@ def register_manage_scene_tools(mcp: FastMCP):
             name: Scene name (no extension) for create/load/save.
             path: Asset path for scene operations (default: "Assets/").
             build_index: Build index for load/build settings actions.
+            editor: Unity Editor to target, by port, project name or project path; 'all' runs read-only actions on every editor. Defaults to the editor on the configured port.
+            as_job: Run in the background, e.g. for loading large scenes, and return a job ID right away; follow it with manage_job.
             # Add other action-specific args as needed (e.g., for hierarchy depth)
 
         Returns:
-            Dictionary with results ('success', 'message', 'data').
+            Dictionary with results ('success', 'message', 'data'). Results too large to return inline, such as big hierarchies, are stored, and 'data' names the unity://results resource to read them from by page or subtree.
         """
         try:
             params = {
@@ -35,23 +58,14 @@ def register_manage_scene_tools(mcp: FastMCP):
             }
             params = {k: v for k, v in params.items() if v is not None}
 
+            if as_job:
+                return submit_job(ctx, "manage_scene", params, editor, finish=process_response)
+
             # Send command to Unity
-            response = get_unity_connection().send_command("manage_scene", params)
-
-            # Process response
-            if response.get("success"):
-                return {
-                    "success": True,
-                    "message": response.get("message", "Scene operation successful."),
-                    "data": response.get("data"),
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": response.get(
-                        "error", "An unknown error occurred during scene management."
-                    ),
-                }
+            response = await get_unity_session(ctx).send_command("manage_scene", params, editor)
+
+            # Process response from Unity
+            return process_response(response)
 
         except Exception as e:
             return {
@@ -1,15 +1,42 @@
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any
-from unity_connection import get_unity_connection
+from unity_connection import get_unity_session
+from jobs import submit_job
 import os
 import base64
 
 
+def process_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn Unity's response into the tool's result, decoding any script contents."""
+    if response.get("success"):
+        # If the response contains encoded content (bytes, or base64), decode it
+        data = response.get("data")
+        if data and data.get("contentsEncoded"):
+            encoded_contents = data["encodedContents"]
+            if isinstance(encoded_contents, str):
+                encoded_contents = base64.b64decode(encoded_contents)
+            decoded_contents = encoded_contents.decode("utf-8")
+            # Copy rather than edit the data, which concurrent identical reads share
+            data = {k: v for k, v in data.items() if k not in ("encodedContents", "contentsEncoded")}
+            data["contents"] = decoded_contents
+
+        return {
+            "success": True,
+            "message": response.get("message", "Operation successful."),
+            "data": data,
+        }
+    else:
+        return {
+            "success": False,
+            "message": response.get("error", "An unknown error occurred."),
+        }
+
+
 def register_manage_script_tools(mcp: FastMCP):
     """Register all script management tools with the MCP server."""
 
     @mcp.tool()
-    def manage_script(
+    async def manage_script(
         ctx: Context,
         action: str,
         name: str,
@@ -17,6 +44,8 @@ def register_manage_script_tools(mcp: FastMCP):
         contents: str | None = None,
         script_type: str | None = None,
         namespace: str | None = None,
+        editor: str | None = None,
+        as_job: bool = False,
     ) -> Dict[str, Any]:
         """Manages C# scripts in Unity (create, read, update, delete).
         Make reference variables public for easier access in the Unity Editor.
@@ -28,6 +57,8 @@ def register_manage_script_tools(mcp: FastMCP):
             contents: C# code for 'create'/'update'.
             script_type: Type hint (e.g., 'MonoBehaviour').
             namespace: Script namespace.
+            editor: Unity Editor to target, by port, project name or project path; 'all' runs 'read' on every editor. Defaults to the editor on the configured port.
+            as_job: Run in the background, e.g. while a write triggers a recompile, and return a job ID right away; follow it with manage_job. The job's result is what the tool would have returned.
 
         Returns:
             Dictionary with results ('success', 'message', 'data').
@@ -42,13 +73,11 @@ def register_manage_script_tools(mcp: FastMCP):
                 "scriptType": script_type,
             }
 
-            # Base64 encode the contents if they exist to avoid JSON escaping issues
+            # Send the contents as UTF-8 bytes to avoid JSON escaping issues. They travel
+            # as a binary attachment, or base64 when the bridge does not support those
             if contents is not None:
                 if action in ["create", "update"]:
-                    # Encode content for safer transmission
-                    params["encodedContents"] = base64.b64encode(
-                        contents.encode("utf-8")
-                    ).decode("utf-8")
+                    params["encodedContents"] = contents.encode("utf-8")
                     params["contentsEncoded"] = True
                 else:
                     params["contents"] = contents
@@ -56,30 +85,16 @@ def register_manage_script_tools(mcp: FastMCP):
             # Remove None values so they don't get sent as null
             params = {k: v for k, v in params.items() if v is not None}
 
-            # Send command to Unity
-            response = get_unity_connection().send_command("manage_script", params)
+            if as_job:
+                return submit_job(ctx, "manage_script", params, editor, finish=process_response)
 
-            # Process response from Unity
-            if response.get("success"):
-                # If the response contains base64 encoded content, decode it
-                if response.get("data", {}).get("contentsEncoded"):
-                    decoded_contents = base64.b64decode(
-                        response["data"]["encodedContents"]
-                    ).decode("utf-8")
-                    response["data"]["contents"] = decoded_contents
-                    del response["data"]["encodedContents"]
-                    del response["data"]["contentsEncoded"]
+            # Send command to Unity, reporting progress while large contents upload
+            response = await get_unity_session(ctx).send_command(
+                "manage_script", params, editor, progress=ctx.report_progress
+            )
 
-                return {
-                    "success": True,
-                    "message": response.get("message", "Operation successful."),
-                    "data": response.get("data"),
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": response.get("error", "An unknown error occurred."),
-                }
+            # Process response from Unity
+            return process_response(response)
 
         except Exception as e:
             # Handle Python-side errors (e.g., connection issues)
@@ -4,14 +4,15 @@ Defines the read_console tool for accessing Unity Editor console messages.
 
 from typing import List, Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from unity_connection import get_unity_session
+from results import offload_large_result
 
 
 def register_read_console_tools(mcp: FastMCP):
     """Registers the read_console tool with the MCP server."""
 
     @mcp.tool()
-    def read_console(
+    async def read_console(
         ctx: Context,
         action: str | None = None,
         types: List[str] | None = None,
@@ -20,6 +21,7 @@ def register_read_console_tools(mcp: FastMCP):
         since_timestamp: str | None = None,
         format: str | None = None,
         include_stacktrace: bool | None = None,
+        editor: str | None = None,
     ) -> Dict[str, Any]:
         """Gets messages from or clears the Unity Editor console.
 
@@ -32,14 +34,12 @@ def register_read_console_tools(mcp: FastMCP):
             since_timestamp: Get messages after this timestamp (ISO 8601).
             format: Output format ('plain', 'detailed', 'json').
             include_stacktrace: Include stack traces in output.
+            editor: Unity Editor to target, by port, project name or project path; 'all' runs read-only actions on every editor. Defaults to the editor on the configured port.
 
         Returns:
-            Dictionary with results. For 'get', includes 'data' (messages).
+            Dictionary with results. For 'get', includes 'data' (messages). Results too large to return inline are stored, and 'data' names the unity://results resource to read them from in pages.
         """
 
-        # Get the connection instance
-        bridge = get_unity_connection()
-
         # Set defaults if values are None
         action = action if action is not None else "get"
         types = types if types is not None else ["error", "warning", "log"]
@@ -72,5 +72,6 @@ def register_read_console_tools(mcp: FastMCP):
         if "count" not in params_dict:
             params_dict["count"] = None
 
-        # Forward the command using the bridge's send_command method
-        return bridge.send_command("read_console", params_dict)
+        # Forward the command to the selected Unity Editor; large logs are stored to read in pages
+        response = await get_unity_session(ctx).send_command("read_console", params_dict, editor)
+        return offload_large_result("read_console", response)
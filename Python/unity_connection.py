@@ -1,10 +1,32 @@
-import socket
+import asyncio
+import base64
+import itertools
+import re
+import struct
 import json
 import logging
-from dataclasses import dataclass
-from typing import Dict, Any
+import os
+import random
+import threading
+import time
+import weakref
+import zlib
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Any
 from config import config
 
+# Optional faster encoders, used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Configure logging using settings from config
 logging.basicConfig(
     level=getattr(logging, config.log_level),
@@ -12,190 +34,2307 @@ logging.basicConfig(
 )
 logger = logging.getLogger("UnityMCP")
 
+# Framed protocol: every message is preceded by a 5-byte header holding the
+# payload length (big-endian uint32) and a flags byte.
+PROTOCOL_VERSION = 1
+FRAME_HEADER = struct.Struct(">IB")
+MAX_FRAME_SIZE = 0x7FFFFFFF
+# The payload is raw DEFLATE (RFC 1951), the format .NET's DeflateStream reads and writes
+FLAG_COMPRESSED = 0x01
+DEFLATE_WBITS = -15
+# The payload is a raw binary value, referenced as {"$attachment": n} by the next message frame
+FLAG_ATTACHMENT = 0x02
+# The payload follows in chunks, each acknowledged by the receiver with an empty FLAG_ACK frame
+FLAG_CHUNKED = 0x04
+FLAG_ACK = 0x08
+# The payload is NDJSON: a header line naming the request, then records of a streamed result.
+# The trailer, an ordinary response frame, ends the stream with the list replaced by a placeholder.
+# On a command frame, the flag asks for the command's list-shaped result to be streamed.
+FLAG_RECORDS = 0x10
+RECORDS_KEY = "$records"
+ATTACHMENT_KEY = "$attachment"
+BINARY_TYPES = (bytes, bytearray, memoryview)
+
+class ConnectionLost(ConnectionError):
+    """The bridge closed the connection before answering."""
+
+class CommandNotSent(ConnectionLost):
+    """The connection was found closed before any of a command was written, so resending it is safe."""
+
+class CommandTimeout(TimeoutError):
+    """Unity did not answer a command within its deadline."""
+
+# Actions that only query editor state, so they may be fanned out or shared between callers
+READ_ONLY_ACTIONS = {
+    "manage_asset": {"search", "get_info", "get_components"},
+    "manage_editor": {"get_state", "get_windows", "get_active_tool", "get_selection", "get_tags", "get_layers"},
+    "manage_gameobject": {"find", "get_components"},
+    "manage_scene": {"get_hierarchy", "get_active", "get_build_settings"},
+    "manage_script": {"read"},
+    "read_console": {"get"},
+    "execute_menu_item": {"get_available_menus"},
+}
+
+def is_read_only(command_type: str, params: Dict[str, Any] = None) -> bool:
+    """Return True if a command only reads editor state."""
+    action = (params or {}).get("action")
+    return command_type == "ping" or (
+        isinstance(action, str) and action.lower() in READ_ONLY_ACTIONS.get(command_type, ()))
+
+def is_resendable(command_type: str, params: Dict[str, Any] = None) -> bool:
+    """Return True if running a command twice is harmless: it, or every command of a batch, only reads."""
+    if command_type == "batch":
+        return all(is_read_only(command["type"], command["params"]) for command in (params or {}).get("commands", ()))
+    return is_read_only(command_type, params)
+
+# Scheduling classes, most urgent first
+PRIORITY_CLASSES = ("interactive", "read", "bulk")
+# Commands that poll or control the editor and should stay fast under load
+INTERACTIVE_COMMANDS = {"ping", "manage_editor", "read_console"}
+
+def command_priority(command_type: str, params: Dict[str, Any] = None) -> str:
+    """Return the scheduling class of a command: interactive and control, read, or bulk mutation."""
+    if command_type in INTERACTIVE_COMMANDS:
+        return "interactive"
+    return "read" if is_read_only(command_type, params) else "bulk"
+
+def singleflight_key(command_type: str, params: Dict[str, Any] = None) -> tuple:
+    """Key under which identical read-only commands share one round trip."""
+    return command_type, json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+def command_deadline(command_type: str) -> float:
+    """Return how long a command may take, from sending it to receiving Unity's answer."""
+    return config.command_timeouts.get(command_type, config.command_timeout)
+
+def requested_features() -> list:
+    """Optional protocol features to request from the bridge, per the config."""
+    features = []
+    if config.multiplexing:
+        features.append("multiplex")
+    if config.compression_threshold > 0:
+        features.append("compress")
+    if config.codec == "msgpack":
+        if msgpack is not None:
+            features.append("msgpack")
+        else:
+            logger.warning("The msgpack codec needs the msgpack package, using JSON")
+    if config.attachments:
+        features.append("attachments")
+    if config.upload_chunk_size > 0:
+        features.append("chunked")
+    if config.streaming:
+        features.append("stream")
+    if config.batch_window > 0:
+        features.append("batch")
+    return features
+
+def build_handshake(features: list) -> bytes:
+    """Build the handshake command offered to the bridge right after connecting."""
+    params = {"version": PROTOCOL_VERSION, "features": features}
+    if "compress" in features:
+        # The bridge compresses its responses by the same rules
+        params["compression"] = {"threshold": config.compression_threshold, "level": config.compression_level}
+    if "chunked" in features:
+        # The bridge acknowledges every chunk of this size it receives
+        params["upload"] = {"chunkSize": config.upload_chunk_size}
+    command = {"type": "handshake", "params": params}
+    return json.dumps(command).encode('utf-8')
+
+# Endpoints whose bridge refused framing. Later connections to them skip the handshake,
+# which such a bridge logs to the Unity console as an unknown command.
+_legacy_bridges: set = set()
+
+def parse_handshake(response_data: bytes | memoryview) -> Dict[str, Any] | None:
+    """Return the bridge's handshake result, or None if it refused framing.
+
+    The result lists the features granted and, from bridges that report it,
+    identifies the editor ("editor": project, path, unityVersion, port).
+
+    Bridges that predate framing answer the handshake with an "unknown command"
+    error, in which case the connection stays in legacy mode.
+    """
+    try:
+        response = json.loads(str(response_data, 'utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if response.get("status") != "success":
+        return None
+    result = response.get("result") or {}
+    if result.get("version") != PROTOCOL_VERSION:
+        return None
+    return result
+
+def extract_attachments(value: Any, attachments: list) -> Any:
+    """Return `value` with bytes values replaced by attachment placeholders.
+
+    The bytes are appended to `attachments`, in placeholder order.
+    """
+    if isinstance(value, BINARY_TYPES):
+        attachments.append(memoryview(value).cast("B"))
+        return {ATTACHMENT_KEY: len(attachments) - 1}
+    if isinstance(value, dict):
+        return {key: extract_attachments(item, attachments) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [extract_attachments(item, attachments) for item in value]
+    return value
+
+def contains_binary(value: Any) -> bool:
+    """Return True if `value` holds bytes anywhere, as large uploads do."""
+    if isinstance(value, BINARY_TYPES):
+        return True
+    if isinstance(value, dict):
+        return any(contains_binary(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(contains_binary(item) for item in value)
+    return False
+
+def resolve_attachments(value: Any, attachments: list) -> Any:
+    """Replace attachment placeholders in a decoded message with the received bytes, in place."""
+    if isinstance(value, dict):
+        if len(value) == 1 and ATTACHMENT_KEY in value:
+            return attachments[value[ATTACHMENT_KEY]]
+        for key, item in value.items():
+            value[key] = resolve_attachments(item, attachments)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = resolve_attachments(item, attachments)
+    return value
+
+def _encode_binary(value: Any) -> str:
+    """Serialize bytes as base64 text for JSON, as bridges without attachments expect."""
+    if isinstance(value, BINARY_TYPES):
+        return base64.b64encode(value).decode('ascii')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class JsonCodec:
+    """UTF-8 JSON, encoded with orjson when it is installed and the standard library otherwise."""
+    name = "json"
+
+    def __init__(self, fast: bool = True):
+        self.fast = fast and orjson is not None
+
+    def encode(self, message: Any) -> bytes:
+        if self.fast:
+            try:
+                return orjson.dumps(message, default=_encode_binary)
+            except TypeError:
+                pass  # e.g. integers wider than 64 bits, which the standard library handles
+        return json.dumps(message, ensure_ascii=False, default=_encode_binary).encode('utf-8')
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        if self.fast:
+            return orjson.loads(data)
+        return json.loads(str(data, 'utf-8'))
+
+class MessagePackCodec:
+    """MessagePack, used on framed connections whose bridge granted the "msgpack" feature."""
+    name = "msgpack"
+
+    def encode(self, message: Any) -> bytes:
+        return msgpack.packb(message, use_bin_type=True)
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+JSON_CODEC = JsonCodec()
+MESSAGEPACK_CODEC = MessagePackCodec()
+
+# Unframed responses are scanned through a reduced view holding only quotes and
+# brackets: escaped quotes and backslashes are dropped first, then everything
+# else is deleted with bytes.translate, so the per-chunk work stays in C.
+_NON_STRUCTURAL_BYTES = bytes(b for b in range(256) if b not in b'"{}[]')
+_QUOTED = re.compile(rb'"[^"]*"')
+_STRUCTURAL_TOKEN = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"|[{}\[\]]')
+
+class ResponseAssembler:
+    """Accumulates an unframed JSON response and detects where it ends.
+
+    Each chunk is scanned once as it arrives while bracket depth and string
+    state are carried between chunks, so completion is detected in linear time
+    without re-joining, re-decoding or re-parsing the buffer after every chunk.
+    The assembler only tracks offsets; the bytes themselves stay wherever the
+    caller received them. The legacy bridge sends exactly one JSON object per
+    response.
+    """
+
+    def __init__(self):
+        self.received = 0  # Bytes fed so far
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._pending_backslash = False
+        self._complete = False
+        self._end = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk; return True once a complete JSON value has been received."""
+        self.received += len(chunk)
+        if not self._complete:
+            self._scan(chunk)
+        return self._complete
+
+    def end(self, data) -> int:
+        """Return the length of the completed JSON value at the start of `data`.
+
+        `data` holds everything fed so far and is only walked when the end
+        could not be pinned down while scanning.
+        """
+        if not self._complete:
+            raise ValueError("Response is not complete")
+        if self._end is None:
+            self._end = self._locate_end(data)
+        return self._end
+
+    def _scan(self, chunk: bytes):
+        original = chunk
+        # An odd run of trailing backslashes escapes the first byte of the next chunk
+        if self._pending_backslash:
+            chunk = b'\\' + chunk
+        trailing = 0
+        while trailing < len(chunk) and chunk[-1 - trailing] == 0x5C:
+            trailing += 1
+        self._pending_backslash = trailing % 2 == 1
+        if self._pending_backslash:
+            chunk = chunk[:-1]
+
+        # Escapes only occur inside strings; removing escaped backslashes before
+        # escaped quotes pairs them up left to right, as a JSON parser would
+        if b'\\' in chunk:
+            chunk = chunk.replace(b'\\\\', b'').replace(b'\\"', b'')
+        tokens = chunk.translate(None, _NON_STRUCTURAL_BYTES)
+
+        start = 0
+        if self._in_string:
+            start = tokens.find(b'"') + 1
+            if start == 0:
+                return  # Still inside the same string
+            self._in_string = False
+        end = len(tokens)
+        if tokens.count(b'"', start) % 2 == 1:
+            end = tokens.rfind(b'"')
+            self._in_string = True
+
+        # Dropping adjacent quotes keeps string parity, and most strings hold no brackets
+        outside = _QUOTED.sub(b'', tokens[start:end].replace(b'""', b''))
+        opened = outside.count(b'{') + outside.count(b'[')
+        closed = len(outside) - opened
+        self._started = self._started or opened > 0
+        self._depth += opened - closed
+        if self._depth > 0 or not self._started:
+            return
+
+        self._complete = True
+        # Only whitespace can follow the closing bracket of a well-formed
+        # response, which makes it the last bracket received
+        if self._depth == 0 and not self._in_string and tokens[-1:] in (b'}', b']'):
+            last = max(original.rfind(b'}'), original.rfind(b']'))
+            self._end = self.received - len(original) + last + 1
+
+    def _locate_end(self, data) -> int:
+        """Find the end of the first complete JSON value with an exact token walk."""
+        depth = 0
+        for match in _STRUCTURAL_TOKEN.finditer(data):
+            token = match.group()
+            if token in (b'{', b'['):
+                depth += 1
+            elif token in (b'}', b']'):
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return len(data)
+
+# Free arena space offered to reads while no message size is known, and the
+# step in which unframed responses are scanned
+READ_CHUNK = 256 * 1024
+
+class ReceiveArena:
+    """Reusable receive buffer owned by one connection.
+
+    The transport reads straight into the free tail of a preallocated
+    bytearray and messages are decoded from memoryviews over it, so responses
+    are never copied into per-read bytes objects or re-joined from chunks.
+    Consumed space is reclaimed by moving unread bytes to the front. The arena
+    grows to fit the largest message and drops back to its initial size once
+    it has grown past `retain` bytes and been drained.
+    """
+
+    def __init__(self, initial: int = config.receive_arena_size, retain: int = config.buffer_size):
+        self.initial = initial
+        self.retain = retain
+        self.buffer = bytearray(initial)
+        self.start = 0  # First unread byte
+        self.end = 0  # One past the last received byte
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def reserve(self, size: int):
+        """Make room for at least `size` more bytes after the unread ones."""
+        if len(self.buffer) - self.end >= size:
+            return
+        unread = self.end - self.start
+        if len(self.buffer) - unread >= size:
+            self.buffer[:unread] = self.buffer[self.start:self.end]
+        else:
+            # Grow into a new buffer so views still held on the old one stay valid
+            grown = bytearray(max(unread + size, 2 * len(self.buffer)))
+            grown[:unread] = memoryview(self.buffer)[self.start:self.end]
+            self.buffer = grown
+        self.start, self.end = 0, unread
+
+    def writable(self) -> memoryview:
+        return memoryview(self.buffer)[self.end:]
+
+    def view(self, size: int, offset: int = 0) -> memoryview:
+        """Return a view of `size` unread bytes; release it before the next read."""
+        return memoryview(self.buffer)[self.start + offset:self.start + offset + size]
+
+    def consume(self, size: int):
+        self.start += size
+        if self.start == self.end:
+            self.start = self.end = 0
+            if len(self.buffer) > self.retain:
+                self.buffer = bytearray(self.initial)
+
+class BridgeProtocol(asyncio.BufferedProtocol):
+    """Receives bridge traffic into a ReceiveArena and paces writes."""
+
+    def __init__(self):
+        self.arena = ReceiveArena()
+        self.transport = None
+        self.wanted = 0  # Unread bytes the reader is waiting for, used to size reads
+        self.eof = False
+        self.closed = asyncio.get_running_loop().create_future()
+        self._waiter = None
+        self._drain_waiter = None
+        self._paused = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # Size the arena for the rest of the awaited message rather than a
+        # fixed read size, so finishing a large frame never doubles it
+        missing = self.wanted - len(self.arena)
+        self.arena.reserve(missing if missing > 0 else READ_CHUNK)
+        return self.arena.writable()
+
+    def buffer_updated(self, nbytes: int):
+        self.arena.end += nbytes
+        self._wake(self._waiter)
+
+    def eof_received(self):
+        self.eof = True
+        self._wake(self._waiter)
+
+    def connection_lost(self, exc):
+        self.eof = True
+        self._wake(self._waiter)
+        self._wake(self._drain_waiter)
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._wake(self._drain_waiter)
+
+    @staticmethod
+    def _wake(waiter: asyncio.Future):
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def read_at_least(self, size: int):
+        """Wait until at least `size` unread bytes are in the arena."""
+        self.wanted = size
+        try:
+            while len(self.arena) < size:
+                if self.eof:
+                    if not len(self.arena):
+                        raise ConnectionLost("Connection closed before receiving data")
+                    raise ConnectionError("Connection closed while receiving data")
+                self._waiter = asyncio.get_running_loop().create_future()
+                await self._waiter
+        finally:
+            self._waiter = None
+            self.wanted = 0
+
+    async def drain(self):
+        """Wait until the transport's write buffer has room again."""
+        if self.transport.is_closing():
+            await asyncio.sleep(0)  # Let connection_lost run, as StreamWriter.drain does
+            raise ConnectionLost("Connection closed while sending")
+        if self._paused:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._drain_waiter
+            finally:
+                self._drain_waiter = None
+            if self.eof and self.transport.is_closing():
+                raise ConnectionLost("Connection closed while sending")
+
+async def open_tcp(host: str, port: int, protocol_factory) -> tuple:
+    """Connect to the bridge's TCP listener."""
+    return await asyncio.get_running_loop().create_connection(protocol_factory, host, port)
+
+async def open_unix(host: str, port: int, protocol_factory) -> tuple:
+    """Connect to the Unix domain socket a same-host bridge listens on next to `port`."""
+    path = config.unix_socket_path.format(port=port)
+    return await asyncio.get_running_loop().create_unix_connection(protocol_factory, path)
+
+# Ways of reaching the bridge, selected by config.transport
+TRANSPORTS = {
+    "tcp": open_tcp,
+    "unix": open_unix,
+}
+
+async def open_transport(host: str, port: int, protocol_factory) -> tuple:
+    """Open a (transport, protocol) pair to the bridge over the configured transport."""
+    opener = TRANSPORTS.get(config.transport)
+    if opener is None:
+        raise ValueError(f"Unknown transport '{config.transport}', expected one of: {', '.join(TRANSPORTS)}")
+    return await opener(host, port, protocol_factory)
+
 @dataclass
-class UnityConnection:
-    """Manages the socket connection to the Unity Editor."""
+class AsyncUnityConnection:
+    """Manages an asyncio connection to the Unity Editor."""
     host: str = config.unity_host
     port: int = config.unity_port
-    sock: socket.socket = None  # Socket for Unity communication
+    transport: asyncio.Transport = None
+    protocol: BridgeProtocol = None  # Owns the receive arena for this connection
+    framed: bool = False  # True once the bridge has accepted length-prefixed framing
+    features: frozenset = frozenset()  # Optional protocol features granted by the bridge
+    editor: Dict[str, Any] = None  # Project and version the bridge reported, if it did
+    codec: Any = JSON_CODEC  # Encoding of commands and responses, per the negotiated features
+    last_io: float = 0.0  # Monotonic time of the last successful exchange with Unity
+    error: str = None  # Why the connection last failed, None while it is believed healthy
+    # Serializes exchanges, or only writes when multiplexing
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Multiplexing state: futures awaiting a response by request ID, and the task routing them
+    pending: Dict[str, asyncio.Future] = field(default_factory=dict)
+    pings: deque = field(default_factory=deque)  # Raw pings awaiting their pong, which carries no ID
+    reader_task: asyncio.Task = None
+    next_request_id: int = 0
+    # Upload flow control: chunks sent but not yet acknowledged, and a signal for each acknowledgement
+    unacked: int = 0
+    acked: asyncio.Event = field(default_factory=asyncio.Event)
 
-    def connect(self) -> bool:
-        """Establish a connection to the Unity Editor."""
-        if self.sock:
+    @property
+    def connected(self) -> bool:
+        return self.transport is not None
+
+    @property
+    def multiplexed(self) -> bool:
+        """True if commands carry request IDs and may be pipelined on this connection."""
+        return "multiplex" in self.features
+
+    @property
+    def compressed(self) -> bool:
+        """True if framed messages above the threshold may be sent deflated."""
+        return "compress" in self.features
+
+    @property
+    def attaching(self) -> bool:
+        """True if bytes values travel as attachment frames rather than base64 text."""
+        return "attachments" in self.features
+
+    @property
+    def streaming(self) -> bool:
+        """True if list-shaped results can be streamed record by record."""
+        return "stream" in self.features
+
+    @property
+    def batching(self) -> bool:
+        """True if several commands can be sent as one batch run in a single editor frame."""
+        return "batch" in self.features
+
+    @property
+    def chunk_size(self) -> int:
+        """Size of upload chunks, or 0 if large frames go out in one write."""
+        return config.upload_chunk_size if "chunked" in self.features else 0
+
+    @property
+    def healthy(self) -> bool:
+        """True while the connection is open, the bridge has not hung up and no I/O on it has failed."""
+        return self.transport is not None and self.error is None and not self.protocol.eof
+
+    async def check_health(self, ttl: float = config.health_check_ttl) -> bool:
+        """Passively check health, pinging only if the connection has idled past `ttl`."""
+        if not self.healthy:
+            return False
+        if ttl and time.monotonic() - self.last_io > ttl:
+            try:
+                await self.send_command("ping")
+            except ConnectionError:
+                return False
+        return True
+
+    async def connect(self, force: bool = False, use_standby: bool = True) -> bool:
+        """Establish a connection to the Unity Editor.
+
+        Fails immediately while the circuit breaker for this editor is open,
+        unless `force` is set (as it is for the breaker's own probes). Takes
+        over the heartbeat's verified standby connection when one is ready,
+        so reconnecting costs no connect or handshake latency. Opening the
+        socket and negotiating the protocol together get config.connect_timeout.
+        """
+        if self.transport:
+            return True
+        breaker = get_circuit_breaker(self.host, self.port)
+        if not force and not breaker.allow():
+            self.error = breaker.describe()
+            return False
+        heartbeat = get_heartbeat(self.host, self.port)
+        standby = heartbeat.take_standby() if heartbeat and use_standby and not force else None
+        if standby is not None:
+            await self.adopt(standby)
+            heartbeat.watch(self)
+            logger.info(f"Switched to the standby connection to Unity at {self.host}:{self.port}")
             return True
+        # A hung editor or dropped SYNs must not stall the caller until the OS gives up
+        deadline = asyncio.get_running_loop().time() + config.connect_timeout
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Unity at {self.host}:{self.port}")
+            async with asyncio.timeout_at(deadline):
+                self.transport, self.protocol = await open_transport(self.host, self.port, BridgeProtocol)
+            logger.info(f"Connected to Unity at {self.host}:{self.port} over {config.transport}")
+        except Exception as e:
+            self.transport = self.protocol = None
+            # The editor went away; it may come back with a bridge that does support framing
+            _legacy_bridges.discard((self.host, self.port))
+            self.error = f"Timed out after {config.connect_timeout}s" if isinstance(e, TimeoutError) else str(e)
+            logger.error(f"Failed to connect to Unity: {self.error}")
+            breaker.record_failure(self.error)
+            return False
+        self.error = None
+        try:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    await self.negotiate()
+            except TimeoutError:
+                raise TimeoutError(f"Unity did not answer the handshake within {config.connect_timeout}s")
+            self.last_io = time.monotonic()
+            breaker.record_success()
+            if heartbeat:
+                heartbeat.watch(self)
             return True
+        except asyncio.CancelledError:
+            self.close()
+            raise
         except Exception as e:
-            logger.error(f"Failed to connect to Unity: {str(e)}")
-            self.sock = None
+            logger.error(f"Protocol negotiation with Unity failed: {str(e)}")
+            await self.fail(e)
+            breaker.record_failure(self.error)
             return False
 
-    def disconnect(self):
+    async def negotiate(self):
+        """Offer length-prefixed framing to the bridge, falling back to legacy mode.
+
+        A bridge that refused is not offered framing again until connecting to it fails.
+        """
+        self.framed, self.features, self.codec = False, frozenset(), JSON_CODEC
+        if not config.framed_protocol or (self.host, self.port) in _legacy_bridges:
+            return
+        self.transport.write(build_handshake(requested_features()))
+        await self.protocol.drain()
+        handshake = self.take(await self.receive_full_response(), parse_handshake)
+        if handshake is None:
+            logger.info("Bridge does not support framing, using legacy protocol")
+            _legacy_bridges.add((self.host, self.port))
+            return
+        features = frozenset(handshake.get("features") or ())
+        self.framed, self.features, self.editor = True, features, handshake.get("editor")
+        self.codec = MESSAGEPACK_CODEC if "msgpack" in features else JSON_CODEC
+        logger.info(f"Using framed protocol v{PROTOCOL_VERSION} with features: {sorted(features) or 'none'}")
+        if self.multiplexed:
+            self.reader_task = asyncio.create_task(self.route_responses())
+
+    async def adopt(self, other: "AsyncUnityConnection"):
+        """Take over the open, negotiated socket of another, idle connection."""
+        reader, other.reader_task = other.reader_task, None
+        if reader:
+            # Stop the other connection's response router before starting this one's
+            reader.cancel()
+            await asyncio.wait([reader])
+        self.transport, self.protocol = other.transport, other.protocol
+        self.framed, self.features, self.codec = other.framed, other.features, other.codec
+        self.editor = other.editor
+        self.last_io, self.error = other.last_io, None
+        other.transport = other.protocol = None
+        other.framed, other.features, other.codec = False, frozenset(), JSON_CODEC
+        if self.multiplexed:
+            self.reader_task = asyncio.create_task(self.route_responses())
+
+    async def disconnect(self):
         """Close the connection to the Unity Editor."""
-        if self.sock:
+        protocol = self.close()
+        if protocol:
             try:
-                self.sock.close()
+                await protocol.closed
             except Exception as e:
                 logger.error(f"Error disconnecting from Unity: {str(e)}")
-            finally:
-                self.sock = None
 
-    def receive_full_response(self, sock, buffer_size=config.buffer_size) -> bytes:
-        """Receive a complete response from Unity, handling chunked data."""
-        chunks = []
-        sock.settimeout(config.connection_timeout)  # Use timeout from config
+    def close(self) -> BridgeProtocol | None:
+        """Start closing the connection without waiting, and return its protocol.
+
+        Safe to call from code that is being cancelled, where awaiting is not.
+        """
+        if not self.transport:
+            return None
+        transport, protocol = self.transport, self.protocol
+        self.transport = self.protocol = None
+        self.framed, self.features, self.codec = False, frozenset(), JSON_CODEC
+        # Wake an upload waiting for acknowledgements; it finds the connection gone
+        self.unacked = 0
+        self.acked.set()
+        if self.reader_task and self.reader_task is not asyncio.current_task():
+            self.reader_task.cancel()
+        self.reader_task = None
+        # Commands still in flight never got an answer
+        pending, self.pending = self.pending, {}
+        pings, self.pings = self.pings, deque()
+        for future in (*pending.values(), *pings):
+            if not future.done():
+                future.set_exception(ConnectionLost("Connection closed before receiving data"))
+        transport.close()
+        return protocol
+
+    async def send_payload(self, payload: bytes, attachments: list = (), progress=None, flags: int = 0):
+        """Write one message to Unity, framing it if the bridge negotiated framing.
+
+        Attachments go out as frames of their own just ahead of the message,
+        whose frame carries `flags`.
+        Frames larger than the upload chunk size are streamed with flow control,
+        and `progress(sent, total)` is awaited after each chunk if given.
+        """
+        if self.transport.is_closing():
+            raise CommandNotSent("Connection closed before sending")
+        size = len(payload) + sum(len(attachment) for attachment in attachments)
+        if not self.chunk_size and size > config.buffer_size / 2:
+            logger.warning(f"Large command detected ({size} bytes). This might cause issues.")
+        if not self.framed:
+            self.transport.write(payload)
+            await self.drain()
+            return
+        frames = [self.frame(attachment, FLAG_ATTACHMENT) for attachment in attachments]
+        frames.append(self.frame(payload, flags))
+        total = sum(len(data) for _, data in frames)
+        buffers, sent = [], 0
+        for header, data in frames:
+            sent += len(data)
+            if not FRAME_HEADER.unpack(header)[1] & FLAG_CHUNKED:
+                buffers.extend((header, data))
+                continue
+            # writelines hands every buffer to the socket without joining them
+            self.transport.writelines(buffers)
+            buffers = []
+            await self.upload(header, data, sent - len(data), total, progress)
+        self.transport.writelines(buffers)
+        await self.drain()
+        if progress is not None and total > self.chunk_size > 0:
+            await progress(total, total)
+
+    async def upload(self, header: bytes, data, sent: int, total: int, progress=None):
+        """Stream one chunked frame, keeping at most `upload_window` chunks unacknowledged.
+
+        `sent` counts the bytes of the message written before this frame.
+        """
+        view = memoryview(data).cast("B")
         try:
-            while True:
-                chunk = sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
-                
-                # Check if we've received a complete response
+            self.transport.write(header)
+            for offset in range(0, len(view), self.chunk_size):
+                await self.wait_for_credit()
+                if self.transport is None or self.transport.is_closing():
+                    raise ConnectionLost("Connection closed during upload")
+                chunk = view[offset:offset + self.chunk_size]
+                self.unacked += 1
+                self.transport.write(chunk)
+                await self.drain()
+                sent += len(chunk)
+                if progress is not None:
+                    await progress(sent, total)
+        except asyncio.CancelledError:
+            # The bridge would read whatever is sent next as the rest of this frame
+            self.error = "Upload abandoned before completing"
+            self.close()
+            raise
+        logger.info(f"Uploaded {len(view)} bytes in chunks of {self.chunk_size}")
+
+    async def wait_for_credit(self):
+        """Wait until fewer than `upload_window` chunks await acknowledgement."""
+        while self.unacked >= config.upload_window:
+            if self.reader_task:
+                # route_responses counts acknowledgements as they arrive
+                self.acked.clear()
+                await self.acked.wait()
+                continue
+            # Nothing else can arrive on a serial connection while its command is unsent
+            size, flags = await self.receive_frame()
+            self.protocol.arena.consume(size)
+            if not flags & FLAG_ACK:
+                raise ConnectionError("Unity answered before the upload completed")
+            self.acknowledge()
+
+    def acknowledge(self):
+        """Count one upload chunk acknowledged by the bridge."""
+        self.unacked = max(self.unacked - 1, 0)
+        self.acked.set()
+
+    async def drain(self):
+        """Wait until the transport can take more data."""
+        try:
+            await self.protocol.drain()
+        except (ConnectionResetError, BrokenPipeError) as e:
+            raise ConnectionLost(f"Connection closed while sending: {str(e)}")
+
+    def frame(self, payload, flags: int = 0) -> tuple:
+        """Return the header and payload buffers of one frame, deflating the payload if it pays off."""
+        if self.compressed and len(payload) >= config.compression_threshold:
+            deflated = zlib.compress(payload, config.compression_level, wbits=DEFLATE_WBITS)
+            if len(deflated) < len(payload):
+                payload, flags = deflated, flags | FLAG_COMPRESSED
+        if len(payload) > MAX_FRAME_SIZE:
+            raise ValueError(f"Message of {len(payload)} bytes exceeds the maximum frame size")
+        if self.chunk_size and len(payload) > self.chunk_size:
+            flags |= FLAG_CHUNKED
+        return FRAME_HEADER.pack(len(payload), flags), payload
+
+    async def receive_payload(self, decode=None) -> Dict[str, Any]:
+        """Read one complete message from Unity and decode it in place.
+
+        Attachment frames preceding a framed message are copied out of the
+        arena and substituted for their placeholders in the decoded message.
+        """
+        decode = decode or self.decode_response
+        if not self.framed:
+            return self.take(await self.receive_full_response(), decode)
+        attachments = []
+        while True:
+            size, flags = await self.receive_frame()
+            if flags & FLAG_ACK:
+                # Acknowledgements of the final upload chunks trail the upload
+                self.protocol.arena.consume(size)
+                self.acknowledge()
+                continue
+            if not flags & FLAG_ATTACHMENT:
+                break
+            attachments.append(self.take(size, bytes, flags))
+        if flags & FLAG_RECORDS:
+            return self.take(size, decode_records, flags)
+        message = self.take(size, decode, flags)
+        return resolve_attachments(message, attachments) if attachments else message
+
+    def decode_response(self, data: bytes | memoryview) -> Dict[str, Any]:
+        return decode_response(data, self.codec)
+
+    def take(self, size: int, decode, flags: int = 0):
+        """Decode the next `size` bytes straight from the receive arena and consume them."""
+        arena = self.protocol.arena
+        try:
+            with arena.view(size) as view:
+                if flags & FLAG_COMPRESSED:
+                    return decode(zlib.decompress(view, wbits=DEFLATE_WBITS))
+                return decode(view)
+        finally:
+            arena.consume(size)
+
+    async def receive_frame(self) -> tuple:
+        """Wait for one length-prefixed frame; return its payload size in the arena and its flags."""
+        protocol = self.protocol
+        await protocol.read_at_least(FRAME_HEADER.size)
+        with protocol.arena.view(FRAME_HEADER.size) as header:
+            length, flags = FRAME_HEADER.unpack(header)
+        protocol.arena.consume(FRAME_HEADER.size)
+        await protocol.read_at_least(length)
+        if not flags & FLAG_ACK:
+            kind = "attachment" if flags & FLAG_ATTACHMENT else "records" if flags & FLAG_RECORDS else "response"
+            logger.info(f"Received complete {kind} ({length} bytes{', compressed' if flags & FLAG_COMPRESSED else ''})")
+        return length, flags
+
+    async def receive_full_response(self) -> int:
+        """Wait for a complete unframed response; return its size in the arena."""
+        assembler = ResponseAssembler()
+        protocol = self.protocol
+        arena = protocol.arena
+        while True:
+            if len(arena) == assembler.received:
                 try:
-                    # Special case for ping-pong
-                    if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
-                        logger.debug("Received ping response")
-                        return data
-                    
-                    # Handle escaped quotes in the content
-                    if '"content":' in decoded_data:
-                        # Find the content field and its value
-                        content_start = decoded_data.find('"content":') + 9
-                        content_end = decoded_data.rfind('"', content_start)
-                        if content_end > content_start:
-                            # Replace escaped quotes in content with regular quotes
-                            content = decoded_data[content_start:content_end]
-                            content = content.replace('\\"', '"')
-                            decoded_data = decoded_data[:content_start] + content + decoded_data[content_end:]
-                    
-                    # Validate JSON format
-                    json.loads(decoded_data)
-                    
-                    # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # We haven't received a complete valid JSON response yet
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    # Continue reading more chunks as this might not be the complete response
+                    await protocol.read_at_least(assembler.received + 1)
+                except ConnectionLost:
+                    raise
+                except ConnectionError:
+                    raise ConnectionError("Connection closed before receiving a complete response")
+            # Scan in bounded steps so a large backlog is never copied at once
+            step = min(len(arena) - assembler.received, READ_CHUNK)
+            with arena.view(step, assembler.received) as chunk:
+                complete = assembler.feed(bytes(chunk))
+            if complete:
+                with arena.view(assembler.received) as data:
+                    size = assembler.end(data)
+                logger.info(f"Received complete response ({size} bytes)")
+                return size
+
+    async def route_responses(self):
+        """Deliver multiplexed responses to the commands waiting on them."""
+        try:
+            while True:
+                response = await self.receive_payload()
+                if isinstance(response, RecordBatch):
+                    stream = self.pending.get(response.header.get("id"))
+                    if isinstance(stream, ResponseStream):
+                        stream.feed(response.records)
                     continue
-        except socket.timeout:
-            logger.warning("Socket timeout during receive")
-            raise Exception("Timeout receiving Unity response")
+                request_id = response.pop("id", None)
+                if request_id is None and self.pings:
+                    # The bridge answers raw pings in order, without an ID
+                    future = self.pings.popleft()
+                else:
+                    future = self.pending.pop(request_id, None)
+                if future is None:
+                    logger.info("Discarding Unity response to an abandoned request")
+                elif not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
+            if self.transport:
+                logger.error(f"Error reading multiplexed responses: {str(e)}")
+                await self.fail(e)
+
+    async def exchange(self, command_type: str, params: Dict[str, Any] = None,
+                       timeout: float = None, progress=None) -> Dict[str, Any]:
+        """Send one command and return the decoded response envelope.
+
+        The whole exchange is bounded by the command's deadline, or `timeout`
+        if given. A command abandoned by its deadline or by cancellation leaves
+        a serial connection out of step with the bridge, so that connection is
+        recycled; a multiplexed one just forgets the request ID.
+        """
+        deadline = command_deadline(command_type) if timeout is None else timeout
+        try:
+            async with asyncio.timeout(deadline):
+                return await self._exchange(command_type, params, progress)
+        except CommandTimeout:
             raise
+        except TimeoutError:
+            logger.warning(f"Unity did not answer {command_type} within {deadline}s")
+            raise CommandTimeout(f"Unity did not answer {command_type} within {deadline}s")
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command to Unity and return its response."""
-        if not self.sock and not self.connect():
-            raise ConnectionError("Not connected to Unity")
-        
+    async def _exchange(self, command_type: str, params: Dict[str, Any] = None, progress=None) -> Dict[str, Any]:
+        async with self.lock:
+            if self.transport and self.protocol.eof:
+                # The bridge hung up while the connection sat idle
+                self.close()
+            if not self.transport and not await self.connect():
+                raise ConnectionError(f"Not connected to Unity: {self.error}")
+            if not self.multiplexed:
+                # Legacy ping bypasses JSON parsing on the bridge
+                attachments = [] if self.attaching else None
+                payload = b"ping" if command_type == "ping" else encode_command(
+                    command_type, params, codec=self.codec, attachments=attachments)
+                try:
+                    await self.send_payload(payload, attachments or (), progress)
+                    response = await self.receive_payload()
+                except asyncio.CancelledError:
+                    # The answer would arrive as the response to the next command
+                    self.error = f"{command_type} was abandoned before Unity answered"
+                    self.close()
+                    raise
+                except Exception as e:
+                    if not isinstance(e, ConnectionLost):
+                        logger.error(f"Communication error with Unity: {str(e)}")
+                    await self.fail(e)
+                    raise
+                self.last_io = time.monotonic()
+                return response
+
+            future = asyncio.get_running_loop().create_future()
+            attachments = [] if self.attaching else None
+            if command_type == "ping":
+                # Raw pings are answered on the bridge's network thread rather than
+                # waiting for an editor frame, as on serial connections
+                request_id = None
+                self.pings.append(future)
+            else:
+                self.next_request_id += 1
+                request_id = str(self.next_request_id)
+                self.pending[request_id] = future
+            try:
+                payload = b"ping" if request_id is None else encode_command(
+                    command_type, params, request_id, self.codec, attachments)
+                await self.send_payload(payload, attachments or (), progress)
+            except asyncio.CancelledError:
+                # Whole frames are already buffered, so the stream stays in sync; an
+                # abandoned chunked upload has closed the connection instead
+                self.abandon(request_id, future)
+                raise
+            except Exception as e:
+                self.abandon(request_id, future)
+                await self.fail(e)
+                raise
+
+        # Other commands may be sent while this one is in flight. If this one is
+        # abandoned, its late response is discarded by ID and the stream stays in sync.
+        try:
+            response = await future
+        finally:
+            self.pending.pop(request_id, None)
+        self.last_io = time.monotonic()
+        return response
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                           timeout: float = None, progress=None) -> Dict[str, Any]:
+        """Send a command to Unity and return its response.
+
+        Commands go out immediately on a connection believed healthy. If it
+        turns out to be closed before the command is written, the command is
+        resent once on a fresh connection. A command the bridge may already have
+        received is only resent if it is read-only: a domain reload drops the
+        connection after running the command that caused it, and running a menu
+        item or script write twice is not harmless. `timeout` overrides the
+        configured deadline for the command type, and `progress(sent, total)`
+        is awaited as chunks of a large command are uploaded.
+        """
         # Special handling for ping command
         if command_type == "ping":
             try:
                 logger.debug("Sending ping to verify connection")
-                self.sock.sendall(b"ping")
-                response_data = self.receive_full_response(self.sock)
-                response = json.loads(response_data.decode('utf-8'))
-                
+                response = await self.exchange("ping", timeout=timeout)
                 if response.get("status") != "success":
                     logger.warning("Ping response was not successful")
-                    self.sock = None
                     raise ConnectionError("Connection verification failed")
-                    
                 return {"message": "pong"}
             except Exception as e:
                 logger.error(f"Ping error: {str(e)}")
-                self.sock = None
+                await self.fail(e)
                 raise ConnectionError(f"Connection verification failed: {str(e)}")
-        
+
         # Normal command handling
-        command = {"type": command_type, "params": params or {}}
-        try:
-            # Check for very large content that might cause JSON issues
-            command_size = len(json.dumps(command))
-            
-            if command_size > config.buffer_size / 2:
-                logger.warning(f"Large command detected ({command_size} bytes). This might cause issues.")
-                
-            logger.info(f"Sending command: {command_type} with params size: {command_size} bytes")
-            
-            # Ensure we have a valid JSON string before sending
-            command_json = json.dumps(command, ensure_ascii=False)
-            self.sock.sendall(command_json.encode('utf-8'))
-            
-            response_data = self.receive_full_response(self.sock)
+        for attempt in (1, 2):
             try:
-                response = json.loads(response_data.decode('utf-8'))
-            except json.JSONDecodeError as je:
-                logger.error(f"JSON decode error: {str(je)}")
-                # Log partial response for debugging
-                partial_response = response_data.decode('utf-8')[:500] + "..." if len(response_data) > 500 else response_data.decode('utf-8')
-                logger.error(f"Partial response: {partial_response}")
-                raise Exception(f"Invalid JSON response from Unity: {str(je)}")
-            
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Unity error")
-                logger.error(f"Unity error: {error_message}")
-                raise Exception(error_message)
-            
-            return response.get("result", {})
+                response = await self.exchange(command_type, params, timeout, progress)
+                break
+            except ConnectionLost as e:
+                if attempt == 1 and (isinstance(e, CommandNotSent) or is_resendable(command_type, params)):
+                    logger.warning(f"Connection to Unity was lost ({str(e)}), resending {command_type}")
+                    continue
+                raise ConnectionError(f"Failed to communicate with Unity: {str(e)}")
+            except Exception as e:
+                raise ConnectionError(f"Failed to communicate with Unity: {str(e)}")
+
+        try:
+            return unwrap_response(response)
         except Exception as e:
-            logger.error(f"Communication error with Unity: {str(e)}")
-            self.sock = None
+            # The connection itself is fine; Unity reported an error for this command
             raise Exception(f"Failed to communicate with Unity: {str(e)}")
 
+    async def send_batch(self, commands: list, timeout: float = None) -> list:
+        """Send commands as one batch that the bridge runs back to back in a single editor frame.
+
+        `commands` holds (command_type, params) pairs. Returns each command's
+        result in order, or the exception it failed with. The batch gets the
+        longest deadline of its commands unless `timeout` is given.
+        """
+        if timeout is None:
+            timeout = max(command_deadline(command_type) for command_type, _ in commands)
+        batch = [{"type": command_type, "params": params or {}} for command_type, params in commands]
+        responses = (await self.send_command("batch", {"commands": batch}, timeout))["responses"]
+        results = []
+        for response in responses:
+            try:
+                results.append(unwrap_response(response))
+            except Exception as e:
+                results.append(Exception(f"Failed to communicate with Unity: {str(e)}"))
+        return results
+
+    async def stream_command(self, command_type: str, params: Dict[str, Any] = None,
+                             timeout: float = None) -> "ResponseStream":
+        """Send a command and return a stream of the records of its list-shaped result.
+
+        A serial connection stays reserved for the stream until it ends or is
+        closed; a multiplexed one keeps serving other commands. `timeout`
+        bounds each wait for more records. Bridges without streaming answer in
+        one response, which is then split into records the same way.
+        """
+        if not self.transport and not await self.connect():
+            raise ConnectionError(f"Not connected to Unity: {self.error}")
+        if not self.streaming:
+            return ResponseStream.from_result(await self.send_command(command_type, params, timeout))
+
+        deadline = command_deadline(command_type) if timeout is None else timeout
+        await self.lock.acquire()
+        try:
+            if not self.transport and not await self.connect():
+                raise ConnectionError(f"Not connected to Unity: {self.error}")
+            attachments = [] if self.attaching else None
+            if self.multiplexed:
+                self.next_request_id += 1
+                request_id = str(self.next_request_id)
+                stream = ResponseStream(deadline, on_close=lambda complete: self.pending.pop(request_id, None))
+                self.pending[request_id] = stream
+            else:
+                request_id = None
+                stream = ResponseStream(deadline, pull=self.pull_records, on_close=self.end_stream)
+            payload = encode_command(command_type, params, request_id, self.codec, attachments)
+            # Flagging the command frame asks the bridge to stream the result
+            await self.send_payload(payload, attachments or (), flags=FLAG_RECORDS)
+        except asyncio.CancelledError:
+            self.close()
+            self.lock.release()
+            raise
+        except Exception as e:
+            self.lock.release()
+            await self.fail(e)
+            raise
+        if self.multiplexed:
+            self.lock.release()
+        return stream
+
+    async def pull_records(self, stream: "ResponseStream"):
+        """Read the next frame of a stream on a serial connection into `stream`."""
+        message = await self.receive_payload()
+        if isinstance(message, RecordBatch):
+            stream.feed(message.records)
+        else:
+            stream.set_result(message)
+
+    def end_stream(self, complete: bool):
+        """Release a serial connection once its stream ends or is abandoned."""
+        if complete:
+            self.last_io = time.monotonic()
+        else:
+            # The rest of the stream would arrive as the response to the next command
+            self.error = "A streamed response was abandoned before it ended"
+            self.close()
+        self.lock.release()
+
+    def abandon(self, request_id: str, future: asyncio.Future):
+        """Forget a multiplexed request that failed before it was fully sent."""
+        self.pending.pop(request_id, None)
+        if future.done() and not future.cancelled():
+            future.exception()  # Failed by closing the connection, and nothing will await it
+
+    async def fail(self, error: BaseException):
+        """Record an I/O failure and close the connection."""
+        self.error = str(error) or type(error).__name__
+        await self.disconnect()
+
+def encode_command(command_type: str, params: Dict[str, Any] = None, request_id: str = None,
+                   codec: JsonCodec | MessagePackCodec = JSON_CODEC, attachments: list = None) -> bytes:
+    """Serialize a command for the bridge in a single pass.
+
+    If `attachments` is a list, bytes values in `params` are moved into it and
+    left as placeholders; otherwise the codec encodes them inline.
+    """
+    params = params or {}
+    if attachments is not None:
+        params = extract_attachments(params, attachments)
+    command = {"type": command_type, "params": params}
+    if request_id is not None:
+        # The bridge reads the ID from the first property without parsing the rest
+        command = {"id": request_id, **command}
+    payload = codec.encode(command)
+    logger.info(f"Sending command: {command_type} with command size: {len(payload)} bytes")
+    return payload
+
+def decode_response(response_data: bytes | memoryview,
+                    codec: JsonCodec | MessagePackCodec = JSON_CODEC) -> Dict[str, Any]:
+    """Decode the envelope of a bridge response."""
+    try:
+        return codec.decode(response_data)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.error(f"{codec.name} decode error: {str(e)}")
+        # Log partial response for debugging
+        partial_response = bytes(response_data[:500]).decode('utf-8', 'replace')
+        logger.error(f"Partial response: {partial_response}{'...' if len(response_data) > 500 else ''}")
+        raise Exception(f"Invalid {codec.name} response from Unity: {str(e)}")
+
+def unwrap_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the result of a decoded response or raise the error Unity reported."""
+    if response.get("status") == "error":
+        error_message = response.get("error") or response.get("message", "Unknown Unity error")
+        logger.error(f"Unity error: {error_message}")
+        raise Exception(error_message)
+    
+    return response.get("result", {})
+
+@dataclass
+class RecordBatch:
+    """The records carried by one records frame of a streamed response."""
+    header: Dict[str, Any]
+    records: list
+
+def decode_records(data: bytes | memoryview) -> RecordBatch:
+    """Decode a records frame: a header line followed by one JSON record per line."""
+    header, _, records = bytes(data).partition(b"\n")
+    # Records never contain raw newlines, so the batch decodes in one call as a JSON array
+    records = b"[" + records.rstrip(b"\n").replace(b"\n", b",") + b"]"
+    return RecordBatch(JSON_CODEC.decode(header), JSON_CODEC.decode(records))
+
+def _records_slot(result: Any) -> tuple | None:
+    """Locate the list a result streams, or its placeholder, as (container, key).
+
+    Like the bridge, this is the result's data if that is a list, else the first list in data.
+    """
+    def holds_records(value):
+        return isinstance(value, list) or (isinstance(value, dict) and RECORDS_KEY in value)
+
+    data = result.get("data") if isinstance(result, dict) else None
+    if holds_records(data):
+        return result, "data"
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if holds_records(value):
+                return data, key
+    return None
+
+def split_records(result: Any) -> list:
+    """Take the list a result would stream out of it, leaving the trailer's placeholder."""
+    slot = _records_slot(result)
+    if slot is None or not isinstance(slot[0][slot[1]], list):
+        return []
+    container, key = slot
+    records, container[key] = container[key], {RECORDS_KEY: len(container[key])}
+    return records
+
+class ResponseStream:
+    """Records of a streamed command result, yielded as they arrive.
+
+    Once iteration ends, `result` holds the rest of the unwrapped result, with
+    the streamed list replaced by {"$records": count}; `assemble` puts records
+    back in its place. Closing the stream early abandons the remaining records.
+    """
+
+    def __init__(self, deadline: float = None, pull=None, on_close=None):
+        self.deadline = deadline
+        self.result = None
+        self.records = deque()
+        self._response = None  # The trailer, once it has arrived
+        self._error = None
+        self._arrived = asyncio.Event()
+        # Serial connections read frames on demand; multiplexed ones are fed by route_responses
+        self._pull = pull
+        self._on_close = on_close
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "ResponseStream":
+        """Build a finished stream from a result received in one response."""
+        stream = cls()
+        stream._response = {"status": "success", "result": result}
+        stream.result = result
+        stream.records.extend(split_records(result))
+        return stream
+
+    # Future-like interface, so multiplexed streams share the pending-request table
+    def done(self) -> bool:
+        return self._response is not None or self._error is not None
+
+    def set_result(self, response: Dict[str, Any]):
+        self._response = response
+        self._arrived.set()
+
+    def set_exception(self, error: BaseException):
+        self._error = error
+        self._arrived.set()
+
+    def feed(self, records: list):
+        self.records.extend(records)
+        self._arrived.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.records and not await self._fill():
+            raise StopAsyncIteration
+        return self.records.popleft()
+
+    async def batches(self) -> AsyncIterator[list]:
+        """Yield the records in lists, as they arrive, to save per-record overhead."""
+        while self.records or await self._fill():
+            batch = list(self.records)
+            self.records.clear()
+            yield batch
+
+    async def _fill(self) -> bool:
+        """Wait for more records; return False once the stream has ended."""
+        try:
+            while not self.records:
+                if self._error is not None:
+                    raise self._error
+                if self._response is not None:
+                    break
+                async with asyncio.timeout(self.deadline):
+                    if self._pull is not None:
+                        await self._pull(self)
+                    else:
+                        self._arrived.clear()
+                        await self._arrived.wait()
+        except TimeoutError:
+            self._close(False)
+            raise CommandTimeout(f"Unity sent no records within {self.deadline}s")
+        except BaseException:
+            self._close(False)
+            raise
+        if self.records:
+            return True
+        self._close(True)
+        if self.result is None:
+            self.result = unwrap_response(self._response)
+            # The bridge sends results carrying attachments whole
+            self.records.extend(split_records(self.result))
+            return bool(self.records)
+        return False
+
+    async def aclose(self):
+        """Stop receiving; records that have not arrived yet are discarded."""
+        self._close(self._response is not None)
+
+    def _close(self, complete: bool):
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close(complete)
+
+    def assemble(self, records: list) -> Dict[str, Any]:
+        """Return the result with `records` in place of the streamed list."""
+        slot = _records_slot(self.result)
+        if slot is not None:
+            container, key = slot
+            container[key] = records
+        return self.result
+
+class CircuitBreaker:
+    """Tracks reachability of one Unity Editor and paces reconnection attempts.
+
+    After `failure_threshold` consecutive connect failures the circuit opens and
+    connect() fails immediately instead of paying for another TCP attempt. A
+    background probe then retries with exponential backoff and jitter; while a
+    probe is in flight the circuit is half-open, and the first successful
+    connection closes it again.
+    """
+
+    def __init__(self, host: str, port: int, failure_threshold: int = config.max_retries,
+                 base_delay: float = config.retry_delay, max_delay: float = config.reconnect_max_delay):
+        self.host = host
+        self.port = port
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = "closed"
+        self.failures = 0  # Consecutive connect failures
+        self.last_error = None
+        self.retry_at = 0.0  # Monotonic time of the next probe while open
+        self._probe_task = None
+
+    def allow(self) -> bool:
+        """Return True if a connection attempt may be made on the request path."""
+        if self.state == "closed":
+            return True
+        self._ensure_probe()
+        return False
+
+    def describe(self) -> str:
+        """Human-readable status for fail-fast errors."""
+        if self.state == "closed":
+            return "reachable"
+        retry_in = max(0.0, self.retry_at - time.monotonic())
+        return (f"Unity at {self.host}:{self.port} is unreachable after {self.failures} failed attempts, "
+                f"next reconnect attempt in {retry_in:.1f}s (last error: {self.last_error})")
+
+    def record_success(self):
+        if self.state != "closed":
+            logger.info(f"Unity at {self.host}:{self.port} is reachable again")
+        self.state = "closed"
+        self.failures = 0
+        self.last_error = None
+
+    def record_failure(self, error: str):
+        self.failures += 1
+        self.last_error = error
+        if self.failures < self.failure_threshold:
+            return
+        # Exponential backoff with equal jitter, so several servers don't retry in lockstep
+        delay = min(self.max_delay, self.base_delay * 2 ** (self.failures - self.failure_threshold))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if self.state == "closed":
+            logger.warning(f"Unity at {self.host}:{self.port} is unreachable, failing fast until it comes back")
+        self.state = "open"
+        self.retry_at = time.monotonic() + delay
+        self._ensure_probe()
+
+    def _ensure_probe(self):
+        """Start the background probe on the running loop unless one is alive."""
+        task = self._probe_task
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            return
+        try:
+            self._probe_task = asyncio.get_running_loop().create_task(self._probe())
+        except RuntimeError:
+            self._probe_task = None  # No loop yet; the next caller on a loop starts it
+
+    async def _probe(self):
+        while self.state != "closed":
+            await asyncio.sleep(max(0.0, self.retry_at - time.monotonic()))
+            self.state = "half_open"
+            probe = AsyncUnityConnection(self.host, self.port)
+            if await probe.connect(force=True):
+                await probe.disconnect()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+            "retry_in": max(0.0, self.retry_at - time.monotonic()) if self.state != "closed" else 0.0,
+        }
+
+_circuit_breakers: Dict[tuple, CircuitBreaker] = {}
+
+def get_circuit_breaker(host: str, port: int) -> CircuitBreaker:
+    """Return the shared circuit breaker for one Unity Editor endpoint."""
+    breaker = _circuit_breakers.get((host, port))
+    if breaker is None:
+        breaker = _circuit_breakers.setdefault((host, port), CircuitBreaker(host, port))
+    return breaker
+
+class Heartbeat:
+    """Checks connections to one Unity Editor off the request path and keeps a hot standby.
+
+    Every `interval` seconds the heartbeat pings connections that have sat idle
+    that long, so a dead socket is found and closed before a tool call reaches
+    it. It also keeps one extra connection open and verified; a connection that
+    has to reconnect adopts the standby instead of paying for a connect and
+    handshake, and the heartbeat opens a replacement straight away.
+    """
+
+    def __init__(self, host: str, port: int, interval: float = config.heartbeat_interval,
+                 standby: bool = config.hot_standby):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.keep_standby = standby
+        self.standby: AsyncUnityConnection = None
+        self._watched = weakref.WeakValueDictionary()  # Open connections by id()
+        self._wakeup = asyncio.Event()
+        self._counters = dict.fromkeys(("pings", "dead_connections", "standbys_opened", "failovers"), 0)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def watch(self, connection: AsyncUnityConnection):
+        """Include a connection in the heartbeat's checks for as long as it exists."""
+        self._watched[id(connection)] = connection
+
+    def take_standby(self) -> AsyncUnityConnection | None:
+        """Hand over the standby connection if it is verified and idle, and start replacing it."""
+        standby = self.standby
+        if standby is None or not standby.healthy or standby.lock.locked() or standby.pending or standby.pings:
+            return None
+        self.standby = None
+        self._watched.pop(id(standby), None)
+        self._counters["failovers"] += 1
+        self._wakeup.set()
+        return standby
+
+    async def _run(self):
+        while True:
+            try:
+                await self._beat()
+            except Exception as e:
+                logger.error(f"Heartbeat for Unity at {self.host}:{self.port} failed: {str(e)}")
+            try:
+                async with asyncio.timeout(self.interval):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _beat(self):
+        # Busy connections prove themselves; idle ones are pinged concurrently
+        idle, dead = [], []
+        for connection in list(self._watched.values()):
+            if connection.lock.locked() or connection.pending:
+                continue
+            if connection.healthy:
+                if time.monotonic() - connection.last_io >= self.interval:
+                    idle.append(connection)
+            elif connection.connected:
+                dead.append(connection)  # The bridge hung up on it
+        self._counters["pings"] += len(idle)
+        results = await asyncio.gather(*(connection.check_health(self.interval) for connection in idle))
+        dead += [connection for connection, alive in zip(idle, results) if not alive]
+        for connection in dead:
+            self._counters["dead_connections"] += 1
+            logger.warning(f"Heartbeat found a dead connection to Unity at {self.host}:{self.port}")
+            connection.close()
+        if self.standby is not None and not self.standby.healthy:
+            await self.standby.disconnect()
+            self.standby = None
+        if self.keep_standby and self.standby is None:
+            await self._open_standby()
+
+    async def _open_standby(self):
+        standby = AsyncUnityConnection(self.host, self.port)
+        if not await standby.connect(use_standby=False):
+            return  # Unreachable; the circuit breaker paces further attempts
+        try:
+            await standby.send_command("ping")
+        except ConnectionError:
+            return
+        self.standby = standby
+        self._counters["standbys_opened"] += 1
+        logger.debug(f"Standby connection to Unity at {self.host}:{self.port} is ready")
+
+    async def stop(self):
+        """Stop the heartbeat and close the standby connection."""
+        self._task.cancel()
+        await asyncio.wait([self._task])
+        if self.standby is not None:
+            await self.standby.disconnect()
+            self.standby = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "watched": len(self._watched),
+            "standby_ready": self.standby is not None and self.standby.healthy,
+            **self._counters,
+        }
+
+# Heartbeats by (event loop, host, port), since connections belong to the loop that opened them
+_heartbeats: Dict[tuple, Heartbeat] = {}
+
+def get_heartbeat(host: str, port: int) -> Heartbeat | None:
+    """Return the heartbeat for one Unity Editor on the running loop, starting it if needed.
+
+    Returns None when heartbeats are disabled.
+    """
+    if not config.heartbeat_interval:
+        return None
+    loop = asyncio.get_running_loop()
+    heartbeat = _heartbeats.get((loop, host, port))
+    if heartbeat is None:
+        for key in [key for key in _heartbeats if key[0].is_closed()]:
+            del _heartbeats[key]
+        heartbeat = _heartbeats[loop, host, port] = Heartbeat(host, port)
+    return heartbeat
+
+async def stop_heartbeats():
+    """Stop the heartbeats running on the current event loop."""
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _heartbeats if key[0] is loop]:
+        await _heartbeats.pop(key).stop()
+
+class CommandScheduler:
+    """Admits commands to Unity by priority class, so polls don't queue behind bulk work.
+
+    At most `capacity` commands run at once, and each class at most its entry
+    in `limits`. When a slot frees, the waiting command with the best priority
+    that its class limit allows goes next. Waiting raises a command's priority
+    by one class every `aging` seconds, so bulk work is never starved.
+    """
+
+    def __init__(self, capacity: int, limits: Dict[str, int] = None, aging: float = config.scheduler_aging):
+        self.capacity = capacity
+        self.limits = dict(config.scheduler_limits if limits is None else limits)
+        self.aging = aging
+        self._running = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._waiters = []  # [priority class, enqueued at, sequence, future]
+        self._sequence = 0
+        self._admitted = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._queued = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._wait_time = dict.fromkeys(PRIORITY_CLASSES, 0.0)
+        self._max_wait = dict.fromkeys(PRIORITY_CLASSES, 0.0)
+
+    def _can_run(self, priority: str) -> bool:
+        return (sum(self._running.values()) < self.capacity
+                and self._running[priority] < self.limits.get(priority, self.capacity))
+
+    def _rank(self, waiter: list, now: float) -> tuple:
+        priority, enqueued, sequence, _ = waiter
+        rank = PRIORITY_CLASSES.index(priority)
+        if self.aging > 0:
+            rank -= (now - enqueued) / self.aging
+        return rank, sequence
+
+    def _dispatch(self):
+        now = time.monotonic()
+        while True:
+            ready = [waiter for waiter in self._waiters if self._can_run(waiter[0])]
+            if not ready:
+                return
+            waiter = min(ready, key=lambda waiter: self._rank(waiter, now))
+            self._waiters.remove(waiter)
+            self._start(waiter[0], now - waiter[1])
+            waiter[3].set_result(None)
+
+    def _start(self, priority: str, waited: float):
+        self._running[priority] += 1
+        self._admitted[priority] += 1
+        self._wait_time[priority] += waited
+        self._max_wait[priority] = max(self._max_wait[priority], waited)
+
+    @asynccontextmanager
+    async def admit(self, priority: str) -> AsyncIterator[None]:
+        """Hold a slot in a priority class for the duration of a `with` block."""
+        # Waiters are only left queued while their class can't run, so a runnable command jumps none of them
+        if self._can_run(priority):
+            self._start(priority, 0.0)
+        else:
+            self._sequence += 1
+            waiter = [priority, time.monotonic(), self._sequence, asyncio.get_running_loop().create_future()]
+            self._waiters.append(waiter)
+            self._queued[priority] += 1
+            try:
+                await waiter[3]
+            except asyncio.CancelledError:
+                if waiter[3].cancelled():
+                    self._waiters.remove(waiter)
+                else:
+                    self._release(priority)  # Admitted just as the caller gave up
+                raise
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def _release(self, priority: str):
+        self._running[priority] -= 1
+        self._dispatch()
+
+    def status(self) -> Dict[str, Any]:
+        """Return running and waiting commands, and wait times, per priority class."""
+        return {priority: {
+            "running": self._running[priority],
+            "waiting": sum(1 for waiter in self._waiters if waiter[0] == priority),
+            "limit": min(self.limits.get(priority, self.capacity), self.capacity),
+            "admitted": self._admitted[priority],
+            "queued": self._queued[priority],
+            "average_wait": self._wait_time[priority] / self._admitted[priority] if self._admitted[priority] else 0.0,
+            "max_wait": self._max_wait[priority],
+        } for priority in PRIORITY_CLASSES}
+
+class UnityConnectionPool:
+    """Bounded pool of AsyncUnityConnections to one Unity Editor.
+
+    The bridge serves every client socket independently and drains all queued
+    commands each editor frame, so independent calls overlap when they check
+    out separate connections. At most `max_size` connections are open at once;
+    idle ones are reused most-recent-first and closed after `idle_timeout`.
+
+    With a `batch_window`, commands sent within the window are coalesced into
+    one batch that the bridge runs in a single editor frame, rather than one
+    frame per round of pooled connections.
+
+    Commands sent through the pool are admitted by a CommandScheduler, so
+    interactive polls get a connection ahead of queued reads and bulk work.
+    With `singleflight`, a read-only command identical to one already in
+    flight waits for that one's answer instead of going to Unity again.
+    """
+
+    def __init__(self, host: str = config.unity_host, port: int = config.unity_port,
+                 max_size: int = config.pool_max_size, idle_timeout: float = config.pool_idle_timeout,
+                 batch_window: float = config.batch_window, batch_max_size: int = config.batch_max_size,
+                 singleflight: bool = config.singleflight):
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.batch_window = batch_window
+        self.batch_max_size = batch_max_size
+        self._batch = []  # (command_type, params, timeout, future) waiting for the window to close
+        self._batch_timer = None
+        self._batch_tasks = set()
+        self.singleflight = singleflight
+        self._flights = {}  # singleflight_key -> task sending that read
+        self._idle = deque()  # (connection, idle since), most recently used last
+        self._slots = asyncio.Semaphore(max_size)
+        self.scheduler = CommandScheduler(max_size)
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._counters = dict.fromkeys(
+            ("checkouts", "created", "reused", "evicted", "discarded", "connect_failures",
+             "batches", "batched_commands", "deduplicated"), 0)
+        self._wait_time = 0.0
+        self._warm_up = None  # Background task opening the first connection
+        self._warm_up_deadline = 0.0
+        self._startup_connect_time = None
+        self._startup_error = None
+
+    def warm_up(self, wait: float = config.startup_wait) -> asyncio.Task:
+        """Start opening a connection in the background.
+
+        Checkouts made meanwhile wait for it, for at most `wait` seconds from
+        now, instead of racing it with connections of their own.
+        """
+        if self._warm_up is None or self._warm_up.done():
+            self._warm_up_deadline = time.monotonic() + wait
+            self._warm_up = asyncio.create_task(self._open_first())
+        return self._warm_up
+
+    async def _open_first(self) -> bool:
+        started = time.monotonic()
+        try:
+            async with self.connection():
+                pass
+        except ConnectionError as e:
+            logger.warning(f"Could not connect to Unity on startup: {str(e)}")
+            self._startup_error = str(e)
+            return False
+        self._startup_connect_time = time.monotonic() - started
+        logger.info(f"Connected to Unity on startup in {self._startup_connect_time * 1000:.1f} ms")
+        return True
+
+    async def _await_warm_up(self):
+        warm_up = self._warm_up
+        if warm_up is None or warm_up.done() or warm_up is asyncio.current_task():
+            return
+        try:
+            async with asyncio.timeout(max(0.0, self._warm_up_deadline - time.monotonic())):
+                connected = await asyncio.shield(warm_up)
+        except TimeoutError:
+            return  # Go ahead and try a connection of our own
+        if not connected:
+            # Don't make a caller that already waited out one failed attempt pay for another
+            raise ConnectionError(self._startup_error)
+
+    async def checkout(self) -> AsyncUnityConnection:
+        """Take a connection from the pool, opening one if none is idle."""
+        if self._closed:
+            raise ConnectionError("Unity connection pool is closed")
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._await_warm_up()
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        self._wait_time += time.monotonic() - started
+        try:
+            await self._evict_idle()
+            while self._idle:
+                connection, _ = self._idle.pop()
+                if await connection.check_health():
+                    self._counters["reused"] += 1
+                    break
+                self._counters["discarded"] += 1
+                await connection.disconnect()
+            else:
+                connection = AsyncUnityConnection(self.host, self.port)
+                if not await connection.connect():
+                    self._counters["connect_failures"] += 1
+                    raise ConnectionError(f"Could not connect to Unity ({connection.error}). Ensure the Unity Editor and MCP Bridge are running.")
+                self._counters["created"] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        self._counters["checkouts"] += 1
+        self._in_use += 1
+        return connection
+
+    async def checkin(self, connection: AsyncUnityConnection):
+        """Return a connection to the pool; broken connections are dropped."""
+        self._in_use -= 1
+        try:
+            if connection.healthy and not self._closed:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self._counters["discarded"] += 1
+                await connection.disconnect()
+            await self._evict_idle()
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncUnityConnection]:
+        """Check out a connection for the duration of a `with` block."""
+        connection = await self.checkout()
+        try:
+            yield connection
+        finally:
+            await self.checkin(connection)
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                           timeout: float = None, progress=None) -> Dict[str, Any]:
+        """Send a command to Unity on a pooled connection and return its response.
+
+        Commands carrying bytes are never batched, so large uploads keep their
+        chunked progress reporting. Identical read-only commands in flight at
+        once share one result, so callers must not modify read results.
+        """
+        if (self.singleflight and command_type != "ping" and is_read_only(command_type, params)
+                and not contains_binary(params)):
+            return await self._send_shared(command_type, params, timeout)
+        return await self._send(command_type, params, timeout, progress)
+
+    async def _send_shared(self, command_type: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        key = singleflight_key(command_type, params)
+        flight = self._flights.get(key)
+        if flight is not None:
+            self._counters["deduplicated"] += 1
+        else:
+            flight = asyncio.ensure_future(self._send(command_type, params, timeout))
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._land(key, done))
+        # The read carries on for the callers sharing it if this one gives up
+        return await asyncio.shield(flight)
+
+    def _land(self, key: tuple, flight: asyncio.Future):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()  # Retrieved here in case every caller gave up
+
+    async def _send(self, command_type: str, params: Dict[str, Any] = None,
+                    timeout: float = None, progress=None) -> Dict[str, Any]:
+        if self.batch_window > 0 and command_type != "ping" and not contains_binary(params):
+            return await self._send_batched(command_type, params, timeout)
+        async with self.scheduler.admit(command_priority(command_type, params)), self.connection() as connection:
+            return await connection.send_command(command_type, params, timeout, progress)
+
+    async def _send_batched(self, command_type: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append((command_type, params, timeout, future))
+        if len(self._batch) >= self.batch_max_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(self.batch_window, self._flush_batch)
+        deadline = command_deadline(command_type) if timeout is None else timeout
+        try:
+            # The batch carries on for the other commands if this caller gives up
+            async with asyncio.timeout(deadline):
+                return await asyncio.shield(future)
+        except TimeoutError:
+            raise CommandTimeout(f"Unity did not answer {command_type} within {deadline}s")
+        except asyncio.CancelledError:
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            raise
+
+    def _flush_batch(self):
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.create_task(self._send_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: list):
+        commands = [(command_type, params) for command_type, params, _, _ in batch]
+        timeout = max(command_deadline(command_type) if timeout is None else timeout
+                      for command_type, _, timeout, _ in batch)
+        # A batch takes one connection, admitted in the class of its most urgent command
+        priority = min((command_priority(command_type, params) for command_type, params in commands),
+                       key=PRIORITY_CLASSES.index)
+        try:
+            async with self.scheduler.admit(priority), self.connection() as connection:
+                if len(batch) == 1:
+                    results = [await connection.send_command(*commands[0], timeout)]
+                elif connection.batching:
+                    results = await connection.send_batch(commands, timeout)
+                    self._counters["batches"] += 1
+                    self._counters["batched_commands"] += len(batch)
+                else:
+                    results = None
+        except Exception as e:
+            results = [e] * len(batch)
+        if results is None:
+            # The bridge predates batches, so send the commands side by side instead
+            results = await asyncio.gather(
+                *(self._send_alone(command_type, params, timeout) for command_type, params, timeout, _ in batch),
+                return_exceptions=True)
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_alone(self, command_type: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        async with self.scheduler.admit(command_priority(command_type, params)), self.connection() as connection:
+            return await connection.send_command(command_type, params, timeout)
+
+    @asynccontextmanager
+    async def stream_command(self, command_type: str, params: Dict[str, Any] = None,
+                             timeout: float = None) -> AsyncIterator[ResponseStream]:
+        """Stream a command's records on a pooled connection held for the `with` block."""
+        async with self.scheduler.admit(command_priority(command_type, params)), self.connection() as connection:
+            stream = await connection.stream_command(command_type, params, timeout)
+            try:
+                yield stream
+            finally:
+                await stream.aclose()
+
+    async def _evict_idle(self):
+        deadline = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < deadline:
+            connection, _ = self._idle.popleft()
+            self._counters["evicted"] += 1
+            await connection.disconnect()
+
+    async def close(self):
+        """Close all idle connections and refuse further checkouts."""
+        self._closed = True
+        while self._idle:
+            connection, _ = self._idle.popleft()
+            await connection.disconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool occupancy, lifetime counters and reachability for tuning."""
+        return {
+            "max_size": self.max_size,
+            "open": self._in_use + len(self._idle),
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "waiting": self._waiting,
+            **self._counters,
+            "average_wait": self._wait_time / self._counters["checkouts"] if self._counters["checkouts"] else 0.0,
+            "startup_connect_time": self._startup_connect_time,
+            "scheduler": self.scheduler.status(),
+            "circuit": get_circuit_breaker(self.host, self.port).status(),
+            "heartbeat": heartbeat.status() if (heartbeat := _heartbeats.get(
+                (asyncio.get_running_loop(), self.host, self.port))) else None,
+        }
+
+# Selectors that send a read-only command to every running editor
+ALL_EDITORS = ("all", "*")
+
+@dataclass
+class UnityEditor:
+    """One Unity Editor known to the router, with the pool of connections to it."""
+    port: int
+    pool: UnityConnectionPool
+    info: Dict[str, Any] = field(default_factory=dict)  # Identity the bridge reported in its handshake
+    in_flight: int = 0
+    commands: int = 0
+    failures: int = 0
+    busy_time: float = 0.0  # Total seconds spent waiting on this editor's answers
+
+    @property
+    def name(self) -> str:
+        project = self.info.get("project")
+        return f"{project}:{self.port}" if project else str(self.port)
+
+    @property
+    def reachable(self) -> bool:
+        return get_circuit_breaker(self.pool.host, self.port).state == "closed"
+
+    def matches(self, selector: str) -> bool:
+        """Return True if `selector` is this editor's port, name, project name or project path."""
+        selector = selector.strip()
+        names = (str(self.port), self.name, self.info.get("project"))
+        if selector.lower() in (name.lower() for name in names if name):
+            return True
+        path = self.info.get("path")
+        return bool(path) and os.path.normcase(os.path.normpath(selector)) == os.path.normcase(os.path.normpath(path))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "port": self.port,
+            "project": self.info.get("project"),
+            "path": self.info.get("path"),
+            "unity_version": self.info.get("unityVersion"),
+            "in_flight": self.in_flight,
+            "commands": self.commands,
+            "failures": self.failures,
+            "average_latency": self.busy_time / self.commands if self.commands else 0.0,
+            "pool": self.pool.stats(),
+        }
+
+class UnityEditorRouter:
+    """Routes commands among the Unity Editors running on this machine.
+
+    Each bridge listens on the first free port from 6400, so discovery probes
+    `ports` and keeps a connection pool per editor found, named by the project
+    it reports. A selector (port, project name or project path) picks the
+    editor for a command; without one, commands go to the default port as
+    before. The selector "all" fans a read-only command out to every editor,
+    and editors sharing a selector, such as one project open on several ports,
+    split read-only work by load.
+    """
+
+    def __init__(self, host: str = config.unity_host, ports: list = None, default_port: int = config.unity_port,
+                 discovery_interval: float = config.editor_discovery_interval):
+        self.host = host
+        self.ports = list(config.editor_ports if ports is None else ports)
+        self.default_port = default_port
+        self.discovery_interval = discovery_interval
+        self.editors: Dict[int, UnityEditor] = {}
+        self._running = []  # Ports of the editors found by the last discovery
+        self._discovered_at = None
+        self._discovery = None
+
+    def editor(self, port: int) -> UnityEditor:
+        """Return the editor on `port`, creating its pool if needed."""
+        editor = self.editors.get(port)
+        if editor is None:
+            editor = self.editors[port] = UnityEditor(port, UnityConnectionPool(self.host, port))
+        return editor
+
+    async def discover(self) -> list:
+        """Probe the configured ports and return the editors listening on them."""
+        # Concurrent callers share one discovery
+        if self._discovery is None or self._discovery.done():
+            self._discovery = asyncio.create_task(self._discover())
+        return await asyncio.shield(self._discovery)
+
+    async def _discover(self) -> list:
+        found = await asyncio.gather(*(self._identify(port) for port in self.ports))
+        for port, alive in zip(self.ports, found):
+            if not alive and port in self.editors and port != self.default_port:
+                await self.editors.pop(port).pool.close()
+        self._running = [port for port, alive in zip(self.ports, found) if alive]
+        self._discovered_at = time.monotonic()
+        logger.info(f"Found {len(self._running)} Unity Editor(s): "
+                    f"{', '.join(self.editors[port].name for port in self._running) or 'none'}")
+        return [self.editors[port] for port in self._running]
+
+    async def _identify(self, port: int) -> bool:
+        # A bare connect is enough to rule a port out without involving its circuit breaker
+        try:
+            async with asyncio.timeout(config.discovery_timeout):
+                transport, _ = await open_transport(self.host, port, BridgeProtocol)
+        except (OSError, TimeoutError):
+            return False
+        transport.close()
+        editor = self.editor(port)
+        if not editor.info:
+            try:
+                async with editor.pool.connection() as connection:
+                    editor.info = connection.editor or {}
+            except ConnectionError:
+                return False
+        return True
+
+    async def select(self, selector: str = None) -> list:
+        """Return the editors a selector names; the default editor if there is none."""
+        if not selector:
+            return [self.editor(self.default_port)]
+        if self._discovered_at is None or time.monotonic() - self._discovered_at > self.discovery_interval:
+            await self.discover()
+        for attempt in (1, 2):
+            running = [self.editors[port] for port in self._running]
+            if selector.strip().lower() in ALL_EDITORS:
+                matched = running
+            else:
+                matched = [editor for editor in running if editor.matches(selector)]
+            if matched:
+                return matched
+            if attempt == 1:
+                await self.discover()  # It may have started since the last discovery
+        if not running:
+            raise ConnectionError("No Unity Editors are running. Ensure the Unity Editor and MCP Bridge are running.")
+        raise ValueError(f"No Unity Editor matches '{selector}'. Running editors: "
+                         f"{', '.join(editor.name for editor in running)}")
+
+    def _pick(self, targets: list, selector: str, command_type: str, params: Dict[str, Any]) -> UnityEditor:
+        if len(targets) > 1 and not is_read_only(command_type, params):
+            raise ValueError(f"'{selector}' matches several Unity Editors ({', '.join(t.name for t in targets)}); "
+                             f"select one by port to run {command_type} {(params or {}).get('action') or ''}".rstrip())
+        # Prefer reachable editors, then the one with the fewest commands in flight
+        return min(targets, key=lambda target: (not target.reachable, target.in_flight))
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None, editor: str = None,
+                           timeout: float = None, progress=None) -> Dict[str, Any]:
+        """Send a command to the editor `editor` selects and return its response.
+
+        With "all", a read-only command runs on every editor and the response
+        maps each editor's name to its result. Other selectors matching several
+        editors send read-only commands to the least loaded one, and refuse
+        commands that change state.
+        """
+        targets = await self.select(editor)
+        if editor and editor.strip().lower() in ALL_EDITORS:
+            return await self.fan_out(command_type, params, targets, timeout)
+        return await self._send(self._pick(targets, editor, command_type, params),
+                                command_type, params, timeout, progress)
+
+    async def fan_out(self, command_type: str, params: Dict[str, Any] = None, editors: str | list = "all",
+                      timeout: float = None) -> Dict[str, Any]:
+        """Run a read-only command on several editors at once; `editors` is a selector or a list."""
+        if not is_read_only(command_type, params):
+            raise ValueError(f"Only read-only commands can be sent to several Unity Editors, not {command_type}")
+        targets = await self.select(editors) if isinstance(editors, str) else editors
+        results = await asyncio.gather(
+            *(self._send(target, command_type, params, timeout) for target in targets), return_exceptions=True)
+        data = {}
+        for target, result in zip(targets, results):
+            if isinstance(result, Exception):
+                result = {"success": False, "error": str(result)}
+            elif isinstance(result, BaseException):
+                raise result
+            data[target.name] = result
+        succeeded = sum(1 for result in results if not isinstance(result, BaseException))
+        return {
+            "success": succeeded > 0,
+            "message": f"{command_type} ran on {succeeded} of {len(targets)} Unity Editors.",
+            "data": data,
+        }
+
+    async def distribute(self, commands: list, editor: str = "all", timeout: float = None) -> list:
+        """Spread independent read-only commands over the editors `editor` selects.
+
+        `commands` holds (command_type, params) pairs. Each goes to the matching
+        editor with the fewest commands in flight when it is sent. Results come
+        back in order, with exceptions in place of commands that failed.
+        """
+        targets = await self.select(editor)
+        for command_type, params in commands:
+            if not is_read_only(command_type, params):
+                raise ValueError(f"Only read-only commands can be distributed across Unity Editors, not {command_type}")
+        # None of the commands is in flight until gather runs them, so count what each editor is handed
+        load = {target.port: target.in_flight for target in targets}
+        sends = []
+        for command_type, params in commands:
+            target = min(targets, key=lambda target: (not target.reachable, load[target.port]))
+            load[target.port] += 1
+            sends.append(self._send(target, command_type, params, timeout))
+        return await asyncio.gather(*sends, return_exceptions=True)
+
+    @asynccontextmanager
+    async def stream_command(self, command_type: str, params: Dict[str, Any] = None, editor: str = None,
+                             timeout: float = None) -> AsyncIterator[ResponseStream]:
+        """Stream a command's records from the editor `editor` selects."""
+        targets = await self.select(editor)
+        if editor and editor.strip().lower() in ALL_EDITORS and len(targets) > 1:
+            raise ValueError("Streamed results come from one Unity Editor; select one instead of 'all'")
+        target = self._pick(targets, editor, command_type, params)
+        target.in_flight += 1
+        started = time.monotonic()
+        try:
+            async with target.pool.stream_command(command_type, params, timeout) as stream:
+                yield stream
+        except Exception:
+            target.failures += 1
+            raise
+        finally:
+            self._finish(target, started)
+
+    async def _send(self, target: UnityEditor, command_type: str, params: Dict[str, Any] = None,
+                    timeout: float = None, progress=None) -> Dict[str, Any]:
+        target.in_flight += 1
+        started = time.monotonic()
+        try:
+            return await target.pool.send_command(command_type, params, timeout, progress)
+        except Exception:
+            target.failures += 1
+            raise
+        finally:
+            self._finish(target, started)
+
+    @staticmethod
+    def _finish(target: UnityEditor, started: float):
+        target.in_flight -= 1
+        target.commands += 1
+        target.busy_time += time.monotonic() - started
+
+    def stats(self) -> Dict[str, Any]:
+        """Return identity, health and load for every known editor, by name."""
+        return {editor.name: {**editor.status(), "running": editor.port in self._running}
+                for editor in self.editors.values()}
+
+_session_ids = itertools.count(1)
+
+@dataclass
+class UnitySession:
+    """One MCP client's use of the shared editor router, with its own counters.
+
+    Commands take the same path as the router's, so clients share pooled
+    connections and in-flight reads. With `affinity` "editor", a selector
+    that matches several editors, such as one project open twice, is pinned
+    to the editor that first served it, so the session keeps seeing one
+    editor's state instead of being spread by load.
+    """
+    router: UnityEditorRouter
+    affinity: str = config.session_affinity
+    id: str = field(default_factory=lambda: f"session-{next(_session_ids)}")
+    pinned: Dict[str, int] = field(default_factory=dict)  # Selector -> port of the editor it is pinned to
+    in_flight: int = 0
+    commands: int = 0
+    failures: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    async def _resolve(self, editor: str, command_type: str, params: Dict[str, Any]) -> str:
+        if self.affinity != "editor" or not editor or editor.strip().lower() in ALL_EDITORS:
+            return editor
+        port = self.pinned.get(editor)
+        if port is not None and port in self.router._running:
+            return str(port)
+        targets = await self.router.select(editor)
+        if len(targets) == 1 or not is_read_only(command_type, params):
+            return editor  # Nothing to pin, or the router refuses the command anyway
+        port = self.pinned[editor] = self.router._pick(targets, editor, command_type, params).port
+        return str(port)
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None, editor: str = None,
+                           timeout: float = None, progress=None) -> Dict[str, Any]:
+        """Send a command for this session; see UnityEditorRouter.send_command."""
+        self.in_flight += 1
+        try:
+            editor = await self._resolve(editor, command_type, params)
+            return await self.router.send_command(command_type, params, editor, timeout, progress)
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.commands += 1
+
+    async def distribute(self, commands: list, editor: str = "all", timeout: float = None) -> list:
+        """Spread commands over editors for this session; see UnityEditorRouter.distribute."""
+        self.in_flight += len(commands)
+        try:
+            results = await self.router.distribute(commands, editor, timeout)
+        except Exception:
+            self.failures += len(commands)
+            raise
+        finally:
+            self.in_flight -= len(commands)
+            self.commands += len(commands)
+        self.failures += sum(1 for result in results if isinstance(result, Exception))
+        return results
+
+    @asynccontextmanager
+    async def stream_command(self, command_type: str, params: Dict[str, Any] = None, editor: str = None,
+                             timeout: float = None) -> AsyncIterator[ResponseStream]:
+        """Stream a command's records for this session; see UnityEditorRouter.stream_command."""
+        self.in_flight += 1
+        try:
+            editor = await self._resolve(editor, command_type, params)
+            async with self.router.stream_command(command_type, params, editor, timeout) as stream:
+                yield stream
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.commands += 1
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "affinity": self.affinity,
+            "pinned": dict(self.pinned),
+            "in_flight": self.in_flight,
+            "commands": self.commands,
+            "failures": self.failures,
+            "age": time.monotonic() - self.started,
+        }
+
+# Event loop that runs the async connections behind the blocking API
+_io_loop = None
+_io_thread = None
+_io_loop_lock = threading.Lock()
+
+def get_io_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop used by blocking callers, starting it if needed."""
+    global _io_loop, _io_thread
+    with _io_loop_lock:
+        if _io_loop is None:
+            _io_loop = asyncio.new_event_loop()
+            _io_thread = threading.Thread(target=_io_loop.run_forever, name="UnityMCP-IO", daemon=True)
+            _io_thread.start()
+        return _io_loop
+
+def run_on_io_loop(coro):
+    """Run a coroutine on the background I/O loop and block until it finishes."""
+    loop = get_io_loop()
+    if threading.current_thread() is _io_thread:
+        coro.close()
+        raise RuntimeError("Blocking Unity calls cannot be made from the I/O loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+@dataclass
+class UnityConnection:
+    """Blocking wrapper around AsyncUnityConnection for synchronous callers."""
+    host: str = config.unity_host
+    port: int = config.unity_port
+    connection: AsyncUnityConnection = None
+
+    def __post_init__(self):
+        if self.connection is None:
+            self.connection = AsyncUnityConnection(self.host, self.port)
+
+    @property
+    def connected(self) -> bool:
+        return self.connection.connected
+
+    @property
+    def framed(self) -> bool:
+        return self.connection.framed
+
+    @property
+    def healthy(self) -> bool:
+        return self.connection.healthy
+
+    def check_health(self, ttl: float = config.health_check_ttl) -> bool:
+        """Passively check health, pinging only if the connection has idled past `ttl`."""
+        return run_on_io_loop(self.connection.check_health(ttl))
+
+    def connect(self) -> bool:
+        """Establish a connection to the Unity Editor."""
+        return run_on_io_loop(self.connection.connect())
+
+    def disconnect(self):
+        """Close the connection to the Unity Editor."""
+        run_on_io_loop(self.connection.disconnect())
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                     timeout: float = None) -> Dict[str, Any]:
+        """Send a command to Unity and return its response."""
+        return run_on_io_loop(self.connection.send_command(command_type, params, timeout))
+
 # Global Unity connection
 _unity_connection = None
 
 def get_unity_connection() -> UnityConnection:
-    """Retrieve or establish a persistent Unity connection."""
+    """Retrieve or establish a persistent Unity connection.
+
+    An existing connection is reused without a round trip while it is believed
+    healthy; commands sent on it are retried once if it turns out to be dead.
+    """
     global _unity_connection
     if _unity_connection is not None:
-        try:
-            # Try to ping with a short timeout to verify connection
-            result = _unity_connection.send_command("ping")
-            # If we get here, the connection is still valid
+        if _unity_connection.check_health():
             logger.debug("Reusing existing Unity connection")
             return _unity_connection
-        except Exception as e:
-            logger.warning(f"Existing connection failed: {str(e)}")
-            try:
-                _unity_connection.disconnect()
-            except:
-                pass
-            _unity_connection = None
-    
-    # Create a new connection
-    logger.info("Creating new Unity connection")
-    _unity_connection = UnityConnection()
-    if not _unity_connection.connect():
-        _unity_connection = None
-        raise ConnectionError("Could not connect to Unity. Ensure the Unity Editor and MCP Bridge are running.")
-    
-    try:
-        # Verify the new connection works
-        _unity_connection.send_command("ping")
-        logger.info("Successfully established new Unity connection")
-        return _unity_connection
-    except Exception as e:
-        logger.error(f"Could not verify new connection: {str(e)}")
+        logger.warning(f"Existing connection failed: {_unity_connection.connection.error}")
         try:
             _unity_connection.disconnect()
         except:
             pass
         _unity_connection = None
-        raise ConnectionError(f"Could not establish valid Unity connection: {str(e)}") 
\ No newline at end of file
+    
+    # Create a new connection; connecting negotiates the protocol with the bridge
+    logger.info("Creating new Unity connection")
+    connection = UnityConnection()
+    if not connection.connect():
+        raise ConnectionError(f"Could not connect to Unity ({connection.connection.error}). Ensure the Unity Editor and MCP Bridge are running.")
+    logger.info("Successfully established new Unity connection")
+    _unity_connection = connection
+    return _unity_connection
+
+# Global editor router, bound to the event loop that created it
+_unity_router = None
+_unity_router_loop = None
+
+def get_unity_router() -> UnityEditorRouter:
+    """Retrieve the editor router for the running event loop, creating it if needed."""
+    global _unity_router, _unity_router_loop
+    loop = asyncio.get_running_loop()
+    if _unity_router is None or _unity_router_loop is not loop:
+        _unity_router, _unity_router_loop = UnityEditorRouter(), loop
+    return _unity_router
+
+def get_unity_session(ctx) -> UnitySession | UnityEditorRouter:
+    """Return the session of the MCP client making a tool call, or the shared router outside one."""
+    try:
+        session = ctx.request_context.lifespan_context.get("session")
+    except (AttributeError, ValueError):
+        session = None
+    return session or get_unity_router()
+
+def get_unity_pool() -> UnityConnectionPool:
+    """Retrieve the connection pool to the default editor on the running event loop."""
+    return get_unity_router().editor(config.unity_port).pool